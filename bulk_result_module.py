@@ -0,0 +1,244 @@
+# bulk_result_module.py
+# ====================================================
+# BULK INTERVIEW RESULT ENTRY (no Streamlit UI)
+# ====================================================
+# Walk-in drives produce 50-200 outcomes at once. Instead of one submit
+# (and one full sync chain) per record, all outcomes are resolved in memory
+# against a single read of Interview_Records and written back with ONE
+# batch_update. Candidate/vacancy propagation is returned to the caller so it
+# can be pushed with status_updater.sync_all_statuses_bulk.
+
+import pandas as pd
+from gspread.utils import rowcol_to_a1
+
+from interview_events import append_events, make_event, status_label
+from optimistic_lock import VERSION_COLUMN, stamps_match
+
+
+BULK_FIELDS = ['Record ID', 'Interview Status', 'Result Status', 'Salary Offered', 'Joining Date']
+
+CANCELLED_STATUS = 'Cancelled due to Selection'
+
+
+def _clean(value):
+    """Stringify a cell value; NaN/None/NaT become empty"""
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def normalize_outcomes(rows):
+    """
+    Convert tuples / dicts / DataFrame rows into outcome dicts keyed by BULK_FIELDS.
+    Tuples follow BULK_FIELDS order. Rows without Record ID are dropped.
+    """
+    if isinstance(rows, pd.DataFrame):
+        rows = rows.to_dict('records')
+
+    outcomes = []
+    for row in rows:
+        if isinstance(row, dict):
+            outcome = {field: _clean(row.get(field, "")) for field in BULK_FIELDS}
+        else:
+            values = list(row) + [""] * (len(BULK_FIELDS) - len(row))
+            outcome = {field: _clean(v) for field, v in zip(BULK_FIELDS, values)}
+        if outcome['Record ID']:
+            outcomes.append(outcome)
+    return outcomes
+
+
+def resolve_bulk_outcomes(all_data, outcomes, keep_selection='current',
+                          updated_by='Admin', timestamp=None, expected_versions=None):
+    """
+    Apply outcomes to an in-memory copy of Interview_Records values.
+
+    Outcomes are applied in entry order with the same rules as the single
+    Update Result form:
+      - Selected cancels the candidate's other PENDING entries
+      - An existing selection for the same candidate is resolved by
+        keep_selection: 'current' rejects the old one, 'existing' rejects the new one
+
+    Args:
+        all_data: worksheet.get_all_values() of Interview_Records
+        outcomes: list of outcome dicts (see normalize_outcomes)
+        keep_selection: 'current' or 'existing'
+        updated_by: value for the Updated By column
+        timestamp: value for Last Updated (defaults to now)
+        expected_versions: optional {record_id: Last Updated seen by the user};
+                           records changed since then are skipped, not overwritten
+
+    Returns:
+        dict with keys:
+            updates   - batch_update payload (only cells that changed)
+            propagate - outcomes for sync_all_statuses_bulk
+            applied   - record ids written
+            cancelled - record ids cancelled due to selection
+            rejected  - record ids rejected by selection conflicts
+            skipped   - list of (record_id, reason)
+            events    - Interview_Events rows, one per changed record
+    """
+    if timestamp is None:
+        timestamp = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    result = {
+        'updates': [], 'propagate': [], 'applied': [],
+        'cancelled': [], 'rejected': [], 'skipped': [], 'events': [],
+    }
+    if not all_data:
+        result['skipped'] = [(o['Record ID'], "Interview_Records sheet is empty") for o in outcomes]
+        return result
+
+    headers = [str(h).strip() for h in all_data[0]]
+    col = {h: i for i, h in enumerate(headers)}
+    required = ['Record ID', 'Candidate ID', 'Interview Status', 'Result Status']
+    missing = [h for h in required if h not in col]
+    if missing:
+        result['skipped'] = [(o['Record ID'], f"Missing columns: {', '.join(missing)}") for o in outcomes]
+        return result
+
+    width = len(headers)
+    original = [list(r) + [""] * (width - len(r)) for r in all_data[1:]]
+    rows = [list(r) for r in original]
+
+    row_of = {}
+    rows_by_candidate = {}
+    for i, r in enumerate(rows):
+        rid = str(r[col['Record ID']]).strip()
+        if rid and rid not in row_of:
+            row_of[rid] = i
+        cand = str(r[col['Candidate ID']]).strip()
+        rows_by_candidate.setdefault(cand, []).append(i)
+
+    def _set(i, header, value):
+        if header in col:
+            rows[i][col[header]] = value
+
+    def _stamp(i):
+        _set(i, 'Last Updated', timestamp)
+        _set(i, 'Updated By', updated_by)
+
+    conflict_rejected = set()
+    notes = {}
+
+    for outcome in outcomes:
+        rid = outcome['Record ID']
+        i = row_of.get(rid)
+        if i is None:
+            result['skipped'].append((rid, "Record not found"))
+            continue
+
+        if expected_versions is not None and rid in expected_versions and VERSION_COLUMN in col:
+            current = original[i][col[VERSION_COLUMN]]
+            if not stamps_match(current, expected_versions[rid]):
+                who = original[i][col['Updated By']] if 'Updated By' in col else ""
+                result['skipped'].append((rid, f"Changed by {who or 'someone else'} at {current} – not saved"))
+                continue
+
+        interview_status = outcome['Interview Status'] or rows[i][col['Interview Status']]
+        result_status = outcome['Result Status'] or rows[i][col['Result Status']]
+
+        _set(i, 'Interview Status', interview_status)
+        _set(i, 'Result Status', result_status)
+        if outcome['Salary Offered']:
+            _set(i, 'Salary Offered', outcome['Salary Offered'])
+        if outcome['Joining Date']:
+            _set(i, 'Joining Date', outcome['Joining Date'])
+        _stamp(i)
+        conflict_rejected.discard(rid)
+        notes[i] = "Bulk entry"
+        if rid not in result['applied']:
+            result['applied'].append(rid)
+
+        if result_status != "Selected":
+            continue
+
+        cand = str(rows[i][col['Candidate ID']]).strip()
+        siblings = [j for j in rows_by_candidate.get(cand, []) if j != i]
+
+        # LOGIC 1: cancel all PENDING entries of this candidate
+        for j in siblings:
+            if str(rows[j][col['Result Status']]).strip() == "Pending":
+                _set(j, 'Result Status', CANCELLED_STATUS)
+                _set(j, 'Interview Status', CANCELLED_STATUS)
+                _stamp(j)
+                notes[j] = CANCELLED_STATUS
+                result['cancelled'].append(str(rows[j][col['Record ID']]).strip())
+
+        # LOGIC 2: resolve multiple SELECTED entries
+        existing = [j for j in siblings if str(rows[j][col['Result Status']]).strip() == "Selected"]
+        if existing:
+            if keep_selection == 'current':
+                for j in existing:
+                    _set(j, 'Result Status', 'Rejected')
+                    _stamp(j)
+                    notes[j] = f"Rejected: new selection {rid}"
+                    result['rejected'].append(str(rows[j][col['Record ID']]).strip())
+            else:
+                _set(i, 'Result Status', 'Rejected')
+                notes[i] = "Rejected: candidate keeps existing selection"
+                result['rejected'].append(rid)
+                conflict_rejected.add(rid)
+
+    # Propagation: final state of every applied record, except the ones that
+    # lost a selection conflict (candidate/vacancy already reflect the old selection)
+    for rid in result['applied']:
+        if rid in conflict_rejected:
+            continue
+        r = rows[row_of[rid]]
+        result['propagate'].append({
+            'record_id': rid,
+            'candidate_id': r[col['Candidate ID']],
+            'company_id': r[col['CID']] if 'CID' in col else "",
+            'job_title': r[col['Job Title']] if 'Job Title' in col else "",
+            'interview_status': r[col['Interview Status']],
+            'result_status': r[col['Result Status']],
+        })
+
+    # One event per touched record: original status -> final status
+    for i in sorted(notes):
+        before, after = original[i], rows[i]
+        result['events'].append(make_event(
+            after[col['Record ID']],
+            updated_by,
+            status_label(before[col['Interview Status']], before[col['Result Status']]),
+            status_label(after[col['Interview Status']], after[col['Result Status']]),
+            notes[i],
+            timestamp,
+        ))
+
+    # One batch_update payload with only the changed cells
+    for i, (before, after) in enumerate(zip(original, rows)):
+        for c, (old, new) in enumerate(zip(before, after)):
+            if str(old) != str(new):
+                result['updates'].append({
+                    'range': rowcol_to_a1(i + 2, c + 1),
+                    'values': [[new]]
+                })
+
+    return result
+
+
+def apply_bulk_results(sheet, outcomes, keep_selection='current', updated_by='Admin',
+                       expected_versions=None):
+    """
+    Resolve outcomes against a fresh read of Interview_Records, write them
+    with a single batch_update and log the transitions to Interview_Events
+    in one append. Returns the resolve_bulk_outcomes result.
+    """
+    all_data = sheet.get_all_values()
+    result = resolve_bulk_outcomes(
+        all_data, outcomes, keep_selection, updated_by, expected_versions=expected_versions
+    )
+    if result['updates']:
+        sheet.batch_update(result['updates'])
+        append_events(sheet.spreadsheet, result['events'])
+    return result
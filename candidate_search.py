@@ -0,0 +1,311 @@
+# candidate_search.py
+# ====================================================
+# CANDIDATE FULL-TEXT SEARCH INDEX (no Streamlit UI)
+# ====================================================
+# In-process inverted index over the text columns of Candidates: names,
+# contact numbers, skills, addresses, graduation fields and references.
+#
+#   postings  term -> (doc ids, weighted term frequencies) as typed arrays
+#   vocab     sorted distinct terms - a prefix query is a bisect range,
+#             a fuzzy query is one rapidfuzz pass over the vocabulary
+#   phones    digits of the phone / contact columns per doc, so any run of
+#             MIN_DIGITS or more digits finds a partial number
+#
+# Ranking is BM25 with field weights (a name hit counts more than an
+# address hit); candidates matching more of the query terms rank first.
+#
+# update_index() is incremental: the searchable text of every row is hashed
+# and only new or changed Candidate IDs are (re)tokenized. Replaced docs are
+# tombstoned and the arrays compacted once too many of them are dead.
+#
+# search() reads the arrays through zero-copy numpy views, so it must not
+# run while update_index() appends to the same state - hold one lock for both.
+
+import re
+from array import array
+from bisect import bisect_left
+from heapq import nlargest
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
+
+
+STATE_VERSION = 1
+STATE_FILE = "candidate_search.pkl"
+
+# Searchable Candidates column -> field weight
+SEARCH_FIELDS = {
+    'Full Name': 3.0,
+    'Father Name': 1.0,
+    'Email': 1.0,
+    'Mobile': 1.0,
+    'Alt Mobile': 1.0,
+    'WhatsApp': 1.0,
+    'Computer Skills': 2.0,
+    'Technical Skills': 2.0,
+    'Other Skills': 2.0,
+    'Current Address': 1.0,
+    'Current City': 1.0,
+    'Current District': 1.0,
+    'Current State': 1.0,
+    'Current PIN': 1.0,
+    'Permanent Address': 1.0,
+    'Permanent City': 1.0,
+    'Permanent District': 1.0,
+    'Permanent State': 1.0,
+    'Permanent PIN': 1.0,
+    'Graduation Degree': 1.5,
+    'Graduation University': 1.5,
+    'Graduation Specialization': 1.5,
+    'Reference 1 Name': 1.0,
+    'Reference 1 Designation': 1.0,
+    'Reference 1 Organization': 1.5,
+    'Reference 1 Contact': 1.0,
+    'Reference 2 Name': 1.0,
+    'Reference 2 Contact': 1.0,
+}
+
+# Columns also searched by digit substring (partial phone numbers)
+PHONE_FIELDS = ['Mobile', 'Alt Mobile', 'WhatsApp', 'Reference 1 Contact', 'Reference 2 Contact']
+MIN_DIGITS = 4
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# A prefix / fuzzy / partial-number hit counts less than the exact term
+EXPANSION_WEIGHT = 0.8
+# Vocabulary terms tried per query term (most frequent first)
+MAX_EXPANSIONS = 50
+FUZZY_EXPANSIONS = 10
+FUZZY_MIN_SCORE = 80
+
+# Compact the arrays when this share of docs is tombstoned
+COMPACT_DEAD_RATIO = 0.25
+
+SEARCH_COLUMNS = ['Candidate ID', 'Score', 'Terms Matched']
+
+_TOKEN = re.compile(r"[0-9a-z][0-9a-z+#.]*")
+_NON_DIGIT = re.compile(r"\D")
+
+
+def tokenize(text):
+    """Lower-case word tokens; keeps c++ / c# / b.tech together"""
+    return [t.rstrip('.') for t in _TOKEN.findall(str(text).lower())]
+
+
+def new_state():
+    return {
+        'version': STATE_VERSION,
+        'doc_ids': [],            # doc id -> Candidate ID
+        'alive': bytearray(),     # doc id -> 1 live / 0 tombstoned
+        'lengths': array('f'),    # doc id -> weighted token count
+        'phones': [],             # doc id -> digit strings joined by spaces
+        'docs': {},               # Candidate ID -> (doc id, row hash)
+        'postings': {},
+        'vocab': [],
+        'total_length': 0.0,
+        'live': 0,
+    }
+
+
+def _text_frame(candidates_df):
+    columns = [c for c in SEARCH_FIELDS if c in candidates_df.columns]
+    return candidates_df[columns].astype(object).fillna("").astype(str)
+
+
+def _add_doc(state, candidate_id, columns, values, row_hash):
+    """Tokenize one row and append it to the postings; returns True if it added new terms"""
+    weights = {}
+    for column, value in zip(columns, values):
+        weight = SEARCH_FIELDS[column]
+        for term in tokenize(value):
+            weights[term] = weights.get(term, 0.0) + weight
+
+    doc = len(state['doc_ids'])
+    state['doc_ids'].append(candidate_id)
+    state['alive'].append(1)
+    length = sum(weights.values())
+    state['lengths'].append(length)
+    state['total_length'] += length
+    state['live'] += 1
+    state['phones'].append(" ".join(
+        _NON_DIGIT.sub("", value) for column, value in zip(columns, values) if column in PHONE_FIELDS
+    ))
+    state['docs'][candidate_id] = (doc, row_hash)
+
+    new_terms = False
+    postings = state['postings']
+    for term, weight in weights.items():
+        entry = postings.get(term)
+        if entry is None:
+            entry = postings[term] = (array('i'), array('f'))
+            new_terms = True
+        entry[0].append(doc)
+        entry[1].append(weight)
+    return new_terms
+
+
+def _remove_doc(state, candidate_id):
+    doc, _ = state['docs'].pop(candidate_id)
+    state['alive'][doc] = 0
+    state['total_length'] -= state['lengths'][doc]
+    state['live'] -= 1
+
+
+def _compact(state):
+    """Drop tombstoned docs and renumber the survivors"""
+    alive = np.frombuffer(state['alive'], dtype=np.uint8).astype(bool)
+    new_ids = (np.cumsum(alive) - 1).astype(np.int32)
+    keep = np.flatnonzero(alive)
+
+    postings = {}
+    for term, (ids, weights) in state['postings'].items():
+        ids = np.frombuffer(ids, dtype=np.int32)
+        live = alive[ids]
+        if live.any():
+            postings[term] = (
+                array('i', new_ids[ids[live]].tobytes()),
+                array('f', np.frombuffer(weights, dtype=np.float32)[live].tobytes()),
+            )
+    lengths = np.frombuffer(state['lengths'], dtype=np.float32)[keep]
+
+    state['postings'] = postings
+    state['vocab'] = sorted(postings)
+    state['doc_ids'] = [state['doc_ids'][i] for i in keep]
+    state['phones'] = [state['phones'][i] for i in keep]
+    state['lengths'] = array('f', lengths.tobytes())
+    state['alive'] = bytearray(b'\x01' * len(keep))
+    state['docs'] = {cid: (int(new_ids[doc]), h) for cid, (doc, h) in state['docs'].items()}
+
+
+def update_index(state, candidates_df):
+    """
+    Fold new / edited Candidates rows into the index and drop removed ones.
+    Returns (state, number of docs added, replaced or removed).
+    """
+    if not state or state.get('version') != STATE_VERSION:
+        state = new_state()
+    if len(candidates_df) == 0 or 'Candidate ID' not in candidates_df.columns:
+        return state, 0
+
+    text = _text_frame(candidates_df)
+    columns = list(text.columns)
+    ids = candidates_df['Candidate ID'].astype(str).str.strip()
+    # Last row wins for a repeated ID (same as the sheet's latest edit)
+    keep = ((ids != "") & ~ids.duplicated(keep='last')).to_numpy()
+    hashes = pd.util.hash_pandas_object(text, index=False).to_numpy()
+    values = text.to_numpy()
+
+    docs = state['docs']
+    current = set(ids[keep])
+    removed = [cid for cid in docs if cid not in current]
+    for cid in removed:
+        _remove_doc(state, cid)
+
+    changed = 0
+    new_terms = False
+    for pos in np.flatnonzero(keep):
+        cid = ids.iat[pos]
+        row_hash = int(hashes[pos])
+        known = docs.get(cid)
+        if known is not None and known[1] == row_hash:
+            continue
+        if known is not None:
+            _remove_doc(state, cid)
+        new_terms |= _add_doc(state, cid, columns, values[pos], row_hash)
+        changed += 1
+
+    dead = len(state['doc_ids']) - state['live']
+    if dead and dead > COMPACT_DEAD_RATIO * len(state['doc_ids']):
+        _compact(state)
+    elif new_terms:
+        state['vocab'] = sorted(state['postings'])
+    return state, changed + len(removed)
+
+
+def _expansions(state, term, fuzzy):
+    """Vocabulary terms a query term stands for: {term: weight}"""
+    postings = state['postings']
+    vocab = state['vocab']
+    found = {}
+    if term in postings:
+        found[term] = 1.0
+
+    start = bisect_left(vocab, term)
+    end = bisect_left(vocab, term + '\uffff', lo=start)
+    prefixed = vocab[start:end]
+    if len(prefixed) > MAX_EXPANSIONS:
+        prefixed = nlargest(MAX_EXPANSIONS, prefixed, key=lambda t: len(postings[t][0]))
+    for match in prefixed:
+        found.setdefault(match, EXPANSION_WEIGHT)
+
+    # Typos: only when the word itself is not in the vocabulary
+    if fuzzy and term not in postings and len(term) >= 4 and not term.isdigit():
+        for match, score, _ in process.extract(
+            term, vocab, scorer=fuzz.ratio, score_cutoff=FUZZY_MIN_SCORE, limit=FUZZY_EXPANSIONS
+        ):
+            found.setdefault(match, EXPANSION_WEIGHT * score / 100)
+    return found
+
+
+def _idf(state, doc_freq):
+    return np.log1p((state['live'] - doc_freq + 0.5) / (doc_freq + 0.5))
+
+
+def search(state, query, limit=50, fuzzy=True):
+    """
+    Ranked candidates for a free-text query (SEARCH_COLUMNS), best first.
+    Every query word also matches as a prefix; fuzzy adds close spellings
+    of words that are not in the index.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not state or not terms or state['live'] == 0:
+        return pd.DataFrame(columns=SEARCH_COLUMNS)
+
+    n = len(state['doc_ids'])
+    alive = np.frombuffer(state['alive'], dtype=np.uint8).astype(bool)
+    lengths = np.frombuffer(state['lengths'], dtype=np.float32)
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / (state['total_length'] / state['live']))
+    total = np.zeros(n, dtype=np.float32)
+    matched = np.zeros(n, dtype=np.int16)
+
+    for term in terms:
+        best = np.zeros(n, dtype=np.float32)
+        for expansion, weight in _expansions(state, term, fuzzy).items():
+            ids, tfs = state['postings'][expansion]
+            ids = np.frombuffer(ids, dtype=np.int32)
+            tfs = np.frombuffer(tfs, dtype=np.float32)
+            scores = weight * _idf(state, len(ids)) * tfs * (BM25_K1 + 1) / (tfs + norm[ids])
+            best[ids] = np.maximum(best[ids], scores)
+
+        if term.isdigit() and len(term) >= MIN_DIGITS:
+            hits = np.flatnonzero(pd.Series(state['phones'], dtype=object).str.contains(term, regex=False))
+            if len(hits):
+                score = EXPANSION_WEIGHT * _idf(state, len(hits))
+                best[hits] = np.maximum(best[hits], score)
+
+        total += best
+        matched += best > 0
+
+    matched[~alive] = 0
+    found = np.flatnonzero(matched)
+    order = found[np.lexsort((-total[found], -matched[found]))][:limit]
+    return pd.DataFrame({
+        'Candidate ID': [state['doc_ids'][i] for i in order],
+        'Score': np.round(total[order].astype(float), 2),
+        'Terms Matched': [f"{matched[i]}/{len(terms)}" for i in order],
+    }, columns=SEARCH_COLUMNS)
+
+
+def result_rows(candidates_df, results):
+    """Candidates rows for search results, in rank order, with the Score in front"""
+    if len(results) == 0:
+        return candidates_df.iloc[0:0]
+    ids = candidates_df['Candidate ID'].astype(str).str.strip()
+    latest = ~ids.duplicated(keep='last')
+    positions = pd.Series(np.flatnonzero(latest.to_numpy()), index=ids[latest])
+    positions = positions.reindex(results['Candidate ID']).dropna().astype(int)
+    rows = candidates_df.iloc[positions.to_numpy()].reset_index(drop=True)
+    rows.insert(0, 'Search Score', results.set_index('Candidate ID').loc[positions.index, 'Score'].to_numpy())
+    return rows
@@ -0,0 +1,107 @@
+# cohort_analysis.py
+# ====================================================
+# REGISTRATION COHORT CONVERSION (no Streamlit UI)
+# ====================================================
+# Candidates are grouped by the month they registered (Date Applied). For
+# each cohort: the share that got matched, interviewed and placed within
+# 30 / 60 / 90 days of registering. First time per stage comes from the
+# funnel_analytics table (one groupby min per stage), all date arithmetic is
+# vectorized - there are no per-day or per-candidate loops.
+#
+# A candidate only counts towards a window once the window has fully
+# elapsed (registered at least N days ago), so recent cohorts are not
+# understated; cells with nobody eligible yet are left empty.
+
+import numpy as np
+import pandas as pd
+
+
+# Cohort stage -> funnel_analytics stage column
+COHORT_STAGES = {'Matched': 'Matched', 'Interviewed': 'Completed', 'Placed': 'Selected'}
+
+WINDOWS = (30, 60, 90)
+
+COHORT_COLUMNS = ['Cohort', 'Cohort Size', 'Stage', 'Window', 'Eligible', 'Reached', 'Rate %']
+
+
+def window_label(stage, days):
+    return f"{stage} ≤{days}d"
+
+
+def candidate_milestones(candidates_df, funnel):
+    """
+    One row per registered candidate: Candidate ID, Registered, Cohort
+    (month start) and days from registration to the first time each
+    COHORT_STAGES stage was reached (NaN = not yet).
+    """
+    columns = ['Candidate ID', 'Registered', 'Cohort'] + list(COHORT_STAGES)
+    if len(candidates_df) == 0 or not {'Candidate ID', 'Date Applied'} <= set(candidates_df.columns):
+        return pd.DataFrame(columns=columns)
+
+    people = pd.DataFrame({
+        'Candidate ID': candidates_df['Candidate ID'].astype(str).str.strip(),
+        'Registered': pd.to_datetime(candidates_df['Date Applied'], errors='coerce'),
+    }).dropna(subset=['Registered']).drop_duplicates('Candidate ID')
+    people['Cohort'] = people['Registered'].dt.to_period('M').dt.to_timestamp()
+
+    if len(funnel) == 0:
+        for stage in COHORT_STAGES:
+            people[stage] = np.nan
+        return people.reset_index(drop=True)
+
+    first = funnel.groupby('Candidate ID')[list(COHORT_STAGES.values())].min()
+    for stage, column in COHORT_STAGES.items():
+        reached = pd.to_datetime(people['Candidate ID'].map(first[column]), errors='coerce')
+        days = (reached - people['Registered']) / pd.Timedelta(days=1)
+        # Stage logged before registration = back-filled data, counts as day 0
+        people[stage] = days.clip(lower=0)
+    return people.reset_index(drop=True)
+
+
+def cohort_table(milestones, now=None, windows=WINDOWS):
+    """
+    Long cohort table (COHORT_COLUMNS): one row per cohort x stage x window.
+    Rate % = Reached / Eligible, NaN while no one in the cohort is old enough.
+    """
+    if len(milestones) == 0:
+        return pd.DataFrame(columns=COHORT_COLUMNS)
+
+    now = pd.Timestamp(now or pd.Timestamp.now())
+    age = ((now - milestones['Registered']) / pd.Timedelta(days=1)).to_numpy()
+    cohorts = milestones['Cohort']
+    sizes = cohorts.value_counts()
+
+    frames = []
+    for days in windows:
+        eligible = age >= days
+        for stage in COHORT_STAGES:
+            reached = eligible & (milestones[stage].to_numpy() <= days)
+            counts = pd.DataFrame({'Eligible': eligible, 'Reached': reached}).groupby(cohorts.to_numpy()).sum()
+            counts['Stage'] = stage
+            counts['Window'] = days
+            frames.append(counts)
+
+    table = pd.concat(frames).rename_axis('Cohort').reset_index()
+    table['Cohort Size'] = table['Cohort'].map(sizes).astype('int64')
+    table['Rate %'] = (table['Reached'] / table['Eligible'].replace(0, np.nan) * 100).round(1)
+    return (
+        table.sort_values(['Cohort', 'Window'], kind='stable')
+        .reset_index(drop=True)
+        .reindex(columns=COHORT_COLUMNS)
+    )
+
+
+def cohort_matrix(table):
+    """Wide view: one row per cohort, one 'Stage ≤Nd' column per stage/window (Rate %)"""
+    if len(table) == 0:
+        return pd.DataFrame()
+    labels = [window_label(stage, days) for days in sorted(table['Window'].unique()) for stage in COHORT_STAGES]
+    wide = (
+        table.assign(Column=[window_label(s, w) for s, w in zip(table['Stage'], table['Window'])])
+        .pivot(index='Cohort', columns='Column', values='Rate %')
+        .reindex(columns=labels)
+    )
+    wide.insert(0, 'Cohort Size', table.drop_duplicates('Cohort').set_index('Cohort')['Cohort Size'])
+    wide.index = wide.index.strftime('%b %Y')
+    wide.columns.name = None
+    return wide
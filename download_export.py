@@ -0,0 +1,158 @@
+"""
+Download Export Module
+Chunked / compressed file exports for every download in the app
+CSV (gzip), XLSX (xlsxwriter, constant-memory) and Parquet (pyarrow)
+Files are built only when the user asks for them and cached per snapshot + filter
+(the snapshot token of the frame itself - sheet_ingest.snapshot_version)
+"""
+
+import gzip
+import io
+import logging
+
+import pandas as pd
+import streamlit as st
+
+from sheet_ingest import snapshot_version
+
+try:
+    import xlsxwriter
+except ImportError:  # optional - XLSX option hidden when missing
+    xlsxwriter = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional - Parquet option hidden when missing
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+# Rows serialized per chunk
+CHUNK_ROWS = 5000
+
+# label -> (file extension, mime type)
+FORMATS = {
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+    "Excel (XLSX)": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+
+def available_formats():
+    """Formats whose writer library is installed"""
+    formats = ["CSV (gzip)"]
+    if xlsxwriter is not None:
+        formats.append("Excel (XLSX)")
+    if pq is not None:
+        formats.append("Parquet")
+    return formats
+
+
+def _chunks(df, chunk_rows=CHUNK_ROWS):
+    for start in range(0, len(df), chunk_rows):
+        yield start, df.iloc[start:start + chunk_rows]
+
+
+def write_csv_gz(df, chunk_rows=CHUNK_ROWS):
+    """gzip-compressed CSV, written chunk by chunk straight into the compressor"""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=6) as gz:
+        with io.TextIOWrapper(gz, encoding="utf-8", newline="") as text:
+            if len(df) == 0:
+                df.to_csv(text, index=False)
+            for start, chunk in _chunks(df, chunk_rows):
+                chunk.to_csv(text, index=False, header=(start == 0))
+    return buffer.getvalue()
+
+
+def _xlsx_cells(chunk):
+    """Plain Python cell values for xlsxwriter (dates as text, NaN/NaT as blank)"""
+    cells = {}
+    for col in chunk.columns:
+        values = chunk[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            values = values.dt.strftime("%Y-%m-%d %H:%M:%S").str.replace(" 00:00:00", "", regex=False)
+        cells[col] = values.astype(object).where(values.notna(), "")
+    return pd.DataFrame(cells, index=chunk.index)
+
+
+def write_xlsx(df, sheet_name="Data", chunk_rows=CHUNK_ROWS):
+    """XLSX via xlsxwriter constant_memory mode (rows flushed as they are written)"""
+    buffer = io.BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {
+        "constant_memory": True,
+        "strings_to_formulas": False,
+        "strings_to_urls": False,
+    })
+    worksheet = workbook.add_worksheet(str(sheet_name)[:31])
+    worksheet.write_row(0, 0, [str(c) for c in df.columns])
+    for start, chunk in _chunks(df, chunk_rows):
+        for offset, row in enumerate(_xlsx_cells(chunk).itertuples(index=False, name=None)):
+            worksheet.write_row(start + offset + 1, 0, row)
+    workbook.close()
+    return buffer.getvalue()
+
+
+def write_parquet(df, chunk_rows=CHUNK_ROWS):
+    """Parquet via pyarrow, one row group per chunk"""
+    buffer = io.BytesIO()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, buffer, row_group_size=chunk_rows, compression="snappy")
+    return buffer.getvalue()
+
+
+def export_bytes(df, fmt, sheet_name="Data"):
+    """Serialize df in one of FORMATS"""
+    if fmt == "Excel (XLSX)":
+        return write_xlsx(df, sheet_name)
+    if fmt == "Parquet":
+        return write_parquet(df)
+    return write_csv_gz(df)
+
+
+@st.cache_resource(ttl=300, max_entries=16)
+def _cached_export(_df, name, version, filter_key, n_rows, fmt):
+    """One built file per (dataset, snapshot token, filter, rows, format), shared by all sessions"""
+    logger.info(f"Building {fmt} export for {name} ({len(_df)} rows)")
+    return export_bytes(_df, fmt, sheet_name=name)
+
+
+def render_download(df, name, key, filter_key=(), label="Download"):
+    """
+    Format picker + lazy download.
+    Nothing is serialized until "Prepare" is clicked; the prepared file stays
+    ready for this session until the snapshot, filter or format changes.
+
+    Args:
+        df: data to export (a fetched snapshot or a view of one); a frame
+            without a snapshot token is rebuilt on every rerun once prepared
+        name: base file name (also the XLSX sheet name)
+        key: unique widget key prefix
+        filter_key: hashable description of the filters that produced df
+            (required for views - they carry their source's token)
+    """
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        fmt = st.selectbox("Format", available_formats(), key=f"{key}_format")
+    extension, mime = FORMATS[fmt]
+    version = snapshot_version(df)
+    cache_key = (name, version, filter_key, len(df), fmt)
+
+    with col2:
+        st.write("")
+        if st.session_state.get(f"{key}_ready") != cache_key:
+            if st.button(f"📦 Prepare {label}", key=f"{key}_prepare", use_container_width=True):
+                st.session_state[f"{key}_ready"] = cache_key
+
+        if st.session_state.get(f"{key}_ready") == cache_key:
+            with st.spinner("Preparing file..."):
+                data = _cached_export(df, *cache_key) if version else export_bytes(df, fmt, sheet_name=name)
+            st.download_button(
+                label=f"📥 {label} ({len(data) / 1024:,.0f} KB)",
+                data=data,
+                file_name=f"{name}.{extension}",
+                mime=mime,
+                key=f"{key}_download",
+                use_container_width=True,
+            )
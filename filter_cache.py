@@ -0,0 +1,115 @@
+# filter_cache.py
+# ====================================================
+# FILTER RESULT CACHE (no Streamlit UI)
+# ====================================================
+# LRU of filter row sets (packed bitmaps from filter_engine) keyed by
+# (dataset, snapshot version, normalized filter chain), shared by every
+# session of the process.
+#
+# A chain is resolved from its longest cached prefix and every
+# intermediate prefix is stored on the way, so adding a filter costs one
+# bitmap AND on top of the shorter chain's result, and reruns that do not
+# touch the filters are plain lookups.
+#
+# Size is bounded in bytes (FILTER_CACHE_MB, default 64). When a dataset
+# moves to a new snapshot version its older entries are dropped at once.
+# Cached bitmaps are marked read-only - callers must not modify them.
+
+import os
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get("FILTER_CACHE_MB", "64")) * 1024 * 1024)
+
+
+def new_cache(max_bytes=DEFAULT_MAX_BYTES):
+    return {
+        'entries': OrderedDict(),  # key -> bitmap, least recently used first
+        'bytes': 0,
+        'max_bytes': max_bytes,
+        'versions': {},            # dataset -> latest snapshot version seen
+        'hits': 0,
+        'misses': 0,
+        'lock': threading.Lock(),
+    }
+
+
+def normalize_chain(chain):
+    """filter_key() form -> canonical form ('in' values de-duplicated and sorted, text trimmed)"""
+    normalized = []
+    for column, op, value in chain:
+        if op == 'in':
+            value = tuple(sorted(set(value), key=str))
+        elif isinstance(value, str):
+            value = value.strip()
+        normalized.append((column, op, value))
+    return tuple(normalized)
+
+
+def _drop(cache, key):
+    cache['bytes'] -= cache['entries'].pop(key).nbytes
+
+
+def _put(cache, key, bitmap):
+    entries = cache['entries']
+    if key in entries:
+        entries.move_to_end(key)
+        return
+    bitmap.setflags(write=False)
+    entries[key] = bitmap
+    cache['bytes'] += bitmap.nbytes
+    while cache['bytes'] > cache['max_bytes'] and len(entries) > 1:
+        _drop(cache, next(iter(entries)))
+
+
+def _switch_version(cache, dataset, version):
+    """Forget a dataset's entries from older snapshots"""
+    if cache['versions'].get(dataset) == version:
+        return
+    cache['versions'][dataset] = version
+    for key in [k for k in cache['entries'] if k[0] == dataset and k[1] != version]:
+        _drop(cache, key)
+
+
+def chain_rows(cache, dataset, version, chain, base_rows, apply_one):
+    """
+    Row set of a filter chain (filter_key form).
+
+    Args:
+        base_rows: () -> row set of the empty chain
+        apply_one: (bitmap, filter) -> bitmap AND-ed with one normalized filter
+    """
+    chain = normalize_chain(chain)
+    bitmap, done = None, 0
+    with cache['lock']:
+        _switch_version(cache, dataset, version)
+        for length in range(len(chain), -1, -1):
+            key = (dataset, version, chain[:length])
+            if key in cache['entries']:
+                cache['entries'].move_to_end(key)
+                bitmap, done = cache['entries'][key], length
+                break
+        cache['hits' if done == len(chain) and bitmap is not None else 'misses'] += 1
+
+    # Compute outside the lock; a racing session at worst computes the same prefix twice
+    if bitmap is None:
+        bitmap = base_rows()
+        with cache['lock']:
+            _put(cache, (dataset, version, ()), bitmap)
+    for length in range(done, len(chain)):
+        bitmap = apply_one(bitmap, chain[length])
+        with cache['lock']:
+            _put(cache, (dataset, version, chain[:length + 1]), bitmap)
+    return bitmap
+
+
+def cache_stats(cache):
+    with cache['lock']:
+        lookups = cache['hits'] + cache['misses']
+        return {
+            'entries': len(cache['entries']),
+            'mb': cache['bytes'] / (1024 * 1024),
+            'max_mb': cache['max_bytes'] / (1024 * 1024),
+            'hit_rate': cache['hits'] / lookups if lookups else 0.0,
+        }
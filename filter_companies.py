@@ -1,166 +0,0 @@
-import streamlit as st
-import pandas as pd
-from sheets_connector import fetch_companies_data, get_column_headers, get_unique_values, apply_filter
-
-
-def render_filter_section():
-    """Main filter UI rendering for companies"""
-    
-    # Initialize session state for filters
-    if 'companies_filters' not in st.session_state:
-        st.session_state.companies_filters = []
-    if 'companies_filtered_df' not in st.session_state:
-        st.session_state.companies_filtered_df = None
-    if 'show_new_companies_filter' not in st.session_state:
-        st.session_state.show_new_companies_filter = True
-    
-    # Header
-    st.markdown("### Filter Companies")
-    # Clear All Filters button (NEW)
-    if st.session_state.companies_filters:
-        col1, col2, col3 = st.columns([2, 2, 1])
-        with col3:
-            if st.button("🗑️ Clear All Filters", key="clear_all_company_filters", type="secondary"):
-                st.session_state.companies_filters = []
-                st.session_state.companies_filtered_df = None
-                st.session_state.show_new_companies_filter = True
-                st.success("✅ All filters cleared!")
-                st.rerun()
-
-    
-    # Get original data
-    sheet_url = "https://docs.google.com/spreadsheets/d/1rpuXdpfwjy0BQcaZcn0Acbh-Se6L3PvyNGiNu4NLcPA/edit?gid=526795080#gid=526795080"
-    original_df = fetch_companies_data(sheet_url, "Sheet4")
-    
-    if original_df is None:
-        st.error("Cannot fetch data. Check credentials and sheet URL.")
-        return
-    
-    # DEBUG: Check all columns
-    with st.expander("🔍 DEBUG - All Columns"):
-        st.write(f"**All columns in data:** {original_df.columns.tolist()}")
-    
-    # 🆕 EXCLUDE CLOSED VACANCIES - Case-insensitive
-    # Try different column name variations
-    status_col = None
-    if 'Status' in original_df.columns:
-        status_col = 'Status'
-    elif 'status' in original_df.columns:
-        status_col = 'status'
-    
-    if status_col:
-        # Case-insensitive check for 'closed' status
-        closed_mask = original_df[status_col].astype(str).str.lower().str.strip() == 'closed'
-        st.write(f"**Closed vacancies found:** {closed_mask.sum()}")
-        original_df = original_df[~closed_mask]
-        st.success(f"✅ **Remaining vacancies:** {len(original_df)}")
-    else:
-        st.warning("⚠️ Status column not found! Showing all vacancies.")
-    
-    if len(original_df) == 0:
-        st.warning("⚠️ All vacancies are closed. No companies available for job matching.")
-        return
-    
-    # Get all headers
-    headers = get_column_headers(original_df)
-    
-    # Display applied filters (read-only display)
-    if st.session_state.companies_filters:
-        st.markdown("**Applied Filters:**")
-        
-        for i, filter_item in enumerate(st.session_state.companies_filters):
-            col1, col2, col3 = st.columns([2, 2, 1])
-            
-            with col1:
-                st.write(f"Filter {i+1}: {filter_item['column']}")
-            
-            with col2:
-                st.write(f"= {filter_item['value']}")
-            
-            with col3:
-                if st.button("Remove", key=f"remove_company_{i}"):
-                    st.session_state.companies_filters.pop(i)
-                    st.rerun()
-        
-        st.markdown("---")
-    
-    # Calculate filtered data based on applied filters
-    working_df = original_df.copy()
-    for filter_item in st.session_state.companies_filters:
-        working_df = apply_filter(working_df, filter_item['column'], filter_item['value'])
-    
-    st.session_state.companies_filtered_df = working_df
-    
-    # Show new filter input ONLY if show_new_companies_filter is True
-    if st.session_state.show_new_companies_filter:
-        st.markdown("**Add Filter:**")
-        
-        col1, col2, col3 = st.columns([2, 2, 1])
-        
-        with col1:
-            selected_column = st.selectbox(
-                "Select Column",
-                headers,
-                key="new_companies_filter_column"
-            )
-        
-        with col2:
-            if selected_column:
-                unique_vals = get_unique_values(working_df, selected_column)
-                selected_value = st.selectbox(
-                    "Select Value",
-                    unique_vals,
-                    key="new_companies_filter_value"
-                )
-            else:
-                selected_value = None
-                st.selectbox("Select Value", [], disabled=True, key="new_companies_filter_value_disabled")
-        
-        with col3:
-            if st.button("Apply", key="apply_companies_filter"):
-                if selected_column and selected_value is not None:
-                    # Add to filters list
-                    st.session_state.companies_filters.append({
-                        'column': selected_column,
-                        'value': selected_value
-                    })
-                    # Hide the input form after applying
-                    st.session_state.show_new_companies_filter = False
-                    st.rerun()
-        
-        st.markdown("---")
-    
-    # Add More Filter button - only show when no active filter input
-    if not st.session_state.show_new_companies_filter:
-        if st.button("➕ Add More Filter", key="add_more_companies_btn", use_container_width=False):
-            st.session_state.show_new_companies_filter = True
-            st.rerun()
-    
-    # Display filtered results
-    st.markdown("---")
-    st.markdown(f"### Filtered Companies ({len(st.session_state.companies_filtered_df)} records)")
-    st.info("ℹ️ Showing only companies with open vacancies (Closed vacancies are excluded)")
-    
-    if len(st.session_state.companies_filtered_df) > 0:
-        # Display filtered data in table format
-        st.dataframe(
-            st.session_state.companies_filtered_df,
-            use_container_width=True,
-            height=300
-        )
-        
-        # Download button
-        csv = st.session_state.companies_filtered_df.to_csv(index=False)
-        st.download_button(
-            label="Download Filtered List (CSV)",
-            data=csv,
-            file_name="filtered_companies.csv",
-            mime="text/csv"
-        )
-    else:
-        st.info("No companies match the selected filters.")
-
-
-def render():
-    """Main entry point for companies filter module"""
-    render_filter_section()
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""
+Filter Component Module
+Advanced Filtering UI shared by every dataset (candidates, companies)
+Filters the app's cached sheet snapshot - no Sheets reads of its own
+Everything cached here is keyed on the frame's own snapshot token
+(sheet_ingest.snapshot_version), never on a separate version cache
+Row sets come from the filter_engine bitmap index, kept in a process-wide
+LRU (filter_cache) keyed by dataset, snapshot version and filter chain
+Query filters (filter_query text) sit in the same chain as column filters
+A session only holds its filter chain; the rows it selects come from the
+shared cache on demand (selection_frame), never as a copied frame
+"""
+
+import numpy as np
+import streamlit as st
+
+from download_export import render_download
+from filter_engine import (
+    build_index, full_bitmap, where_values, subtract, filter_bitmap,
+    count_rows, select_rows, describe_filter, filter_key, filters_from_key,
+)
+from filter_query import compile_query, evaluate
+from filter_cache import new_cache, chain_rows
+from filter_inputs import render_filter_input
+from filter_presets import render_presets
+from paged_table import render_paged_table
+from sheet_ingest import snapshot_version
+
+# Per dataset: session keys (job matching reads the filter chains), the status
+# value whose rows are never offered, and UI wording
+FILTER_DATASETS = {
+    'candidates': {
+        'title': "Filter Candidates",
+        'noun': "candidates",
+        'filters_key': 'filters',
+        'show_new_key': 'show_new_filter',
+        'status_columns': ['Status'],
+        'exclude_status': 'selected',
+        'all_excluded': "⚠️ All candidates are already selected. No candidates available for filtering.",
+        'scope_note': "ℹ️ Showing only candidates with Status: Pending, Demo, Hold, Rejected (Selected candidates are excluded)",
+        'export_name': "filtered_candidates",
+    },
+    'companies': {
+        'title': "Filter Companies",
+        'noun': "companies",
+        'filters_key': 'companies_filters',
+        'show_new_key': 'show_new_companies_filter',
+        'status_columns': ['Status', 'status'],
+        'exclude_status': 'closed',
+        'all_excluded': "⚠️ All vacancies are closed. No companies available for job matching.",
+        'scope_note': "ℹ️ Showing only companies with open vacancies (Closed vacancies are excluded)",
+        'export_name': "filtered_companies",
+    },
+}
+
+
+@st.cache_resource(ttl=300, max_entries=4)
+def get_filter_index(_df, dataset, version):
+    """Value -> row bitmap index of a dataset snapshot, built once per snapshot (version = its token)"""
+    return build_index(_df)
+
+
+@st.cache_resource(ttl=300, max_entries=64)
+def get_query_plan(_index, dataset, version, text):
+    """Compiled filter_query plan - once per query text and snapshot"""
+    return compile_query(text, _index)
+
+
+@st.cache_resource
+def get_filter_cache():
+    """Row-set LRU shared by every session (size: FILTER_CACHE_MB)"""
+    return new_cache()
+
+
+def get_filter_rows(index, df, dataset, filters):
+    """
+    Row set of a filter chain, from the shared LRU. A chain that extends a
+    cached one only applies the new filters, so opening a saved preset or
+    adding a filter never re-applies the whole chain.
+    """
+    version = snapshot_version(df)
+
+    def base_rows():
+        return _base_rows(index, df, FILTER_DATASETS[dataset])
+
+    def apply_one(bitmap, item):
+        filter_item = filters_from_key([item])[0]
+        if filter_item['op'] == 'query':
+            plan = get_query_plan(index, dataset, version, filter_item['value'])
+            return evaluate(plan, index, bitmap)
+        return np.bitwise_and(bitmap, filter_bitmap(index, filter_item))
+
+    return chain_rows(get_filter_cache(), dataset, version, filter_key(filters), base_rows, apply_one)
+
+
+def _status_column(df, config):
+    return next((c for c in config['status_columns'] if c in df.columns), None)
+
+
+def _base_rows(index, df, config):
+    """All rows minus the excluded status (case-insensitive)"""
+    status_col = _status_column(df, config)
+    if status_col is None:
+        return full_bitmap(index)
+    excluded = where_values(
+        index, status_col,
+        lambda v: v.astype(str).str.lower().str.strip() == config['exclude_status'],
+    )
+    return subtract(full_bitmap(index), excluded)
+
+
+def _index_of(dataset, df):
+    return get_filter_index(df, dataset, snapshot_version(df))
+
+
+def query_frame(dataset, df, text):
+    """
+    Rows of a dataset snapshot matching a filter_query (excluded status left
+    out, as in the filter UI). Raises ValueError for an invalid query.
+    """
+    index = _index_of(dataset, df)
+    query = {'column': "Query", 'op': 'query', 'value': text.strip()}
+    return select_rows(df, index, get_filter_rows(index, df, dataset, [query]))
+
+
+def selection_frame(dataset, df):
+    """
+    This session's Advanced Filtering result over df, or None if the session
+    has not opened the dataset's filter page. Built per call from the shared
+    row-set cache - callers should not keep it in st.session_state.
+    """
+    filters = st.session_state.get(FILTER_DATASETS[dataset]['filters_key'])
+    if filters is None or df is None or len(df) == 0:
+        return None
+    index = _index_of(dataset, df)
+    return select_rows(df, index, get_filter_rows(index, df, dataset, filters))
+
+
+def _render_query_input(index, dataset, version, filters):
+    """Text query added to the chain as one filter"""
+    with st.expander("🧮 Add a query filter", expanded=False):
+        st.caption(
+            'e.g. status in (Pending, Hold) and city ~ "indore" and expected_salary <= 18000 · '
+            "operators: = != < <= > >= ~ (contains) ~~ (similar) in / not in · and, or, not, ( )"
+        )
+        text = st.text_area("Query", key=f"{dataset}_query_text", height=80).strip()
+        if st.button("Apply Query", key=f"{dataset}_apply_query", disabled=not text):
+            try:
+                get_query_plan(index, dataset, version, text)
+            except ValueError as e:
+                st.error(f"❌ {e}")
+                return
+            filters.append({'column': "Query", 'op': 'query', 'value': text})
+            st.rerun()
+
+
+def render_filter_section(dataset, df):
+    """
+    Cascading filter UI for one dataset snapshot (FILTER_DATASETS key).
+    The chain stays in st.session_state[filters_key]; job matching reads it
+    through selection_frame().
+    """
+    config = FILTER_DATASETS[dataset]
+    filters_key = config['filters_key']
+    show_new_key = config['show_new_key']
+
+    # Initialize session state for filters
+    if filters_key not in st.session_state:
+        st.session_state[filters_key] = []
+    if show_new_key not in st.session_state:
+        st.session_state[show_new_key] = True
+
+    # Header
+    st.markdown(f"### {config['title']}")
+    # Clear All Filters button
+    if st.session_state[filters_key]:
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col3:
+            if st.button("🗑️ Clear All Filters", key=f"{dataset}_clear_all_filters", type="secondary"):
+                st.session_state[filters_key] = []
+                st.session_state[show_new_key] = True
+                st.success("✅ All filters cleared!")
+                st.rerun()
+
+    if df is None or len(df) == 0:
+        st.error(f"No {config['noun']} data available. Check the Google Sheets connection.")
+        return
+
+    version = snapshot_version(df)
+    index = get_filter_index(df, dataset, version)
+
+    def rows_for(filters):
+        return get_filter_rows(index, df, dataset, filters)
+
+    available = count_rows(rows_for([]))
+    if _status_column(df, config) is None:
+        st.warning("⚠️ Status column not found! Showing all rows.")
+    elif available < index['n']:
+        st.caption(f"{index['n'] - available:,} {config['exclude_status']} row(s) excluded · {available:,} available")
+
+    if available == 0:
+        st.warning(config['all_excluded'])
+        return
+
+    # Saved presets (row counts come from the same cached row sets)
+    render_presets(dataset, filters_key, show_new_key, lambda filters: count_rows(rows_for(filters)))
+
+    # Display applied filters (read-only display)
+    filters = st.session_state[filters_key]
+    if filters:
+        st.markdown("**Applied Filters:**")
+
+        for i, filter_item in enumerate(filters):
+            col1, col2, col3 = st.columns([2, 2, 1])
+
+            with col1:
+                st.write(f"Filter {i+1}: {filter_item['column']}")
+
+            with col2:
+                st.write(describe_filter(filter_item, with_column=False))
+
+            with col3:
+                if st.button("Remove", key=f"{dataset}_remove_{i}"):
+                    filters.pop(i)
+                    st.rerun()
+
+        st.markdown("---")
+
+    # Filtered data for the applied chain (bitwise AND on the index, cached)
+    row_set = rows_for(filters)
+
+    # Show new filter input ONLY while no filter is being applied
+    if st.session_state[show_new_key]:
+        st.markdown("**Add Filter:**")
+
+        col1, col2, col3 = st.columns([2, 2, 1])
+
+        with col1:
+            selected_column = st.selectbox("Select Column", list(df.columns), key=f"{dataset}_new_filter_column")
+
+        with col2:
+            if selected_column:
+                new_filter = render_filter_input(index, selected_column, row_set, key=f"{dataset}_new_filter")
+            else:
+                new_filter = None
+                st.selectbox("Select Value", [], disabled=True, key=f"{dataset}_new_filter_value_disabled")
+
+        with col3:
+            if st.button("Apply", key=f"{dataset}_apply_filter"):
+                if new_filter is not None:
+                    filters.append(new_filter)
+                    # Hide the input form after applying
+                    st.session_state[show_new_key] = False
+                    st.rerun()
+
+        _render_query_input(index, dataset, version, filters)
+
+        st.markdown("---")
+
+    # Add More Filter button - only show when no active filter input
+    if not st.session_state[show_new_key]:
+        if st.button("➕ Add More Filter", key=f"{dataset}_add_more_filter"):
+            st.session_state[show_new_key] = True
+            st.rerun()
+
+    # Display filtered results
+    result_df = select_rows(df, index, row_set)
+    st.markdown("---")
+    st.markdown(f"### Filtered {config['noun'].title()} ({len(result_df)} records)")
+    st.info(config['scope_note'])
+
+    if len(result_df) > 0:
+        render_paged_table(
+            result_df, f"{dataset}_filtered_table",
+            filter_key=filter_key(filters), height=300,
+        )
+
+        # Download (built only on request, cached per snapshot + filter set)
+        render_download(
+            result_df,
+            config['export_name'],
+            key=f"{config['export_name']}_export",
+            filter_key=filter_key(filters),
+            label="Download Filtered List",
+        )
+    else:
+        st.info(f"No {config['noun']} match the selected filters.")
@@ -0,0 +1,321 @@
+# filter_engine.py
+# ====================================================
+# BITMAP-INDEXED FILTER ENGINE (no Streamlit UI)
+# ====================================================
+# build_index() factorizes every column of a snapshot once. Each column
+# keeps its sorted distinct values and one integer code per row; columns
+# with at most MAX_BITMAP_VALUES distinct values also keep one packed
+# bitmap (np.packbits, 1 bit per row) per value.
+#
+# A row set is a packed bitmap. Applying a chain of filters is a bitwise AND
+# of per-filter bitmaps, and the values / counts offered for the next
+# filter come from the index (popcount per value bitmap, or a bincount of
+# the codes of the selected rows) - never from rescanning the frame. The
+# same counts are the facets shown next to each value in the dropdowns.
+#
+# Operators (filter = {'column', 'op', 'value'}; no 'op' means equals):
+#   equals / in  - value bitmaps OR-ed together
+#   between      - (low, high) on numbers or dates
+#   compare      - (symbol, operand), symbol one of < <= > >= on numbers or dates
+#   contains     - case-insensitive substring
+#   fuzzy        - (text, min score) rapidfuzz similarity
+#   query        - filter_query text; compiled and evaluated by the caller
+# between / compare / contains / fuzzy are evaluated once per DISTINCT value of the
+# column and turned into a row set through the codes, so their cost grows
+# with the number of distinct values, not with the number of rows.
+#
+# The index is built from a shared read-only snapshot; cache it per
+# snapshot version.
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
+
+
+# Columns with more distinct values than this use codes only (no bitmaps)
+MAX_BITMAP_VALUES = 256
+
+OPERATORS = {
+    'equals': '=',
+    'in': 'in',
+    'between': 'between',
+    'compare': '',
+    'contains': 'contains',
+    'fuzzy': '≈',
+    'query': '',
+}
+
+COMPARISONS = {
+    '<': np.less,
+    '<=': np.less_equal,
+    '>': np.greater,
+    '>=': np.greater_equal,
+}
+
+FUZZY_MIN_SCORE = 80
+
+# Set bits per byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def build_index(df, max_bitmap_values=MAX_BITMAP_VALUES):
+    """
+    Per-column value index of df.
+
+    Returns dict:
+        n        - row count
+        columns  - {column: {'values': Index of distinct values (sorted),
+                             'codes': int32 array (-1 = missing),
+                             'bitmaps': uint8 array [value, packed rows] or None}}
+    """
+    n = len(df)
+    index = {'n': n, 'columns': {}}
+    for pos, column in enumerate(df.columns):
+        if column in index['columns']:
+            continue  # duplicate header - first one wins
+        codes, values = pd.factorize(df.iloc[:, pos], sort=True)
+        codes = codes.astype(np.int32)
+        bitmaps = None
+        if len(values) <= max_bitmap_values:
+            bitmaps = np.packbits(codes[None, :] == np.arange(len(values), dtype=np.int32)[:, None], axis=1)
+        index['columns'][column] = {'values': values, 'codes': codes, 'bitmaps': bitmaps}
+    return index
+
+
+def full_bitmap(index):
+    """Row set with every row"""
+    return np.packbits(np.ones(index['n'], dtype=bool))
+
+
+def empty_bitmap(index):
+    return np.packbits(np.zeros(index['n'], dtype=bool))
+
+
+def mask_bitmap(mask):
+    """Boolean row mask -> packed bitmap"""
+    return np.packbits(np.asarray(mask, dtype=bool))
+
+
+def count_rows(bitmap):
+    """Number of rows in a row set"""
+    return int(_POPCOUNT[bitmap].sum())
+
+
+def row_positions(index, bitmap):
+    """Row set -> sorted row positions"""
+    return np.flatnonzero(np.unpackbits(bitmap, count=index['n']))
+
+
+def codes_bitmap(index, column, codes):
+    """Row set of the rows whose value code is in codes"""
+    entry = index['columns'][column]
+    codes = np.asarray(codes, dtype=np.int32)
+    if len(codes) == 0:
+        return empty_bitmap(index)
+    if entry['bitmaps'] is not None:
+        return np.bitwise_or.reduce(entry['bitmaps'][codes], axis=0)
+    return mask_bitmap(np.isin(entry['codes'], codes))
+
+
+def value_bitmap(index, column, values):
+    """Row set of the rows whose column equals any of values"""
+    if column not in index['columns']:
+        return empty_bitmap(index)
+    codes = index['columns'][column]['values'].get_indexer(pd.Index(list(values)))
+    return codes_bitmap(index, column, codes[codes >= 0])
+
+
+def where_values(index, column, predicate):
+    """
+    Row set of the rows whose value satisfies predicate. predicate gets the
+    column's distinct values (Index) and returns a boolean array, so the
+    test runs once per distinct value instead of once per row.
+    """
+    if column not in index['columns']:
+        return empty_bitmap(index)
+    values = index['columns'][column]['values']
+    return codes_bitmap(index, column, np.flatnonzero(np.asarray(predicate(values), dtype=bool)))
+
+
+def subtract(bitmap, other):
+    """Rows of bitmap that are not in other"""
+    return np.bitwise_and(bitmap, np.invert(other))
+
+
+def column_kind(index, column):
+    """'date', 'number' or 'text' - decides which operators / inputs make sense"""
+    values = index['columns'][column]['values']
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return 'date'
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return 'number'
+    text = pd.Series(values.astype(str)).str.strip()
+    text = text[text != ""]
+    if len(text) > 0 and (~np.isnan(_as_numbers(pd.Index(text)))).mean() >= 0.9:
+        return 'number'
+    return 'text'
+
+
+def _as_numbers(values):
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return pd.Series(values, dtype='Float64').to_numpy(dtype=float, na_value=np.nan)
+    return pd.to_numeric(pd.Series(values.astype(str)).str.replace(',', '', regex=False).str.strip(),
+                         errors='coerce').to_numpy(dtype=float)
+
+
+def _between(values, low, high):
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        stamps = pd.Series(values)
+        keep = stamps.notna()
+        if low is not None:
+            keep &= stamps >= pd.Timestamp(low)
+        if high is not None:
+            # A bare date as upper bound includes that whole day
+            end = pd.Timestamp(high)
+            keep &= (stamps < end + pd.Timedelta(days=1)) if end == end.normalize() else (stamps <= end)
+        return keep.to_numpy()
+    numbers = _as_numbers(values)
+    keep = ~np.isnan(numbers)
+    if low is not None:
+        keep &= numbers >= float(low)
+    if high is not None:
+        keep &= numbers <= float(high)
+    return keep
+
+
+def _compare(values, symbol, operand):
+    compare = COMPARISONS[symbol]
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        stamps = pd.Series(values)
+        return (stamps.notna() & compare(stamps, pd.Timestamp(operand))).to_numpy()
+    numbers = _as_numbers(values)
+    with np.errstate(invalid='ignore'):
+        return ~np.isnan(numbers) & compare(numbers, float(operand))
+
+
+def _fuzzy(values, query, min_score):
+    choices = [str(v) for v in values]
+    if not choices or not str(query).strip():
+        return np.zeros(len(choices), dtype=bool)
+    scores = process.cdist([str(query)], choices, scorer=fuzz.WRatio, processor=str.lower)[0]
+    return scores >= min_score
+
+
+def filter_bitmap(index, filter_item):
+    """Row set matched by one filter {'column', 'op', 'value'}"""
+    column = filter_item['column']
+    op = filter_item.get('op', 'equals')
+    value = filter_item['value']
+    if column not in index['columns']:
+        return empty_bitmap(index)
+
+    if op == 'equals':
+        return value_bitmap(index, column, [value])
+    if op == 'in':
+        return value_bitmap(index, column, list(value))
+    if op == 'between':
+        low, high = value
+        return where_values(index, column, lambda v: _between(v, low, high))
+    if op == 'compare':
+        symbol, operand = value
+        return where_values(index, column, lambda v: _compare(v, symbol, operand))
+    if op == 'contains':
+        needle = str(value).strip()
+        return where_values(index, column, lambda v: pd.Series(v.astype(str)).str.contains(
+            needle, case=False, regex=False).to_numpy())
+    if op == 'fuzzy':
+        query, min_score = value if isinstance(value, (list, tuple)) else (value, FUZZY_MIN_SCORE)
+        return where_values(index, column, lambda v: _fuzzy(v, query, min_score))
+    raise ValueError(f"Unknown filter operator: {op}")
+
+
+def describe_filter(filter_item, with_column=True):
+    """Short text for the applied-filters list, e.g. 'City in Indore, Bhopal'"""
+    op = filter_item.get('op', 'equals')
+    value = filter_item['value']
+    if op == 'in':
+        text = ", ".join(str(v) for v in value)
+    elif op == 'between':
+        low, high = value
+        text = f"{'…' if low is None else low} – {'…' if high is None else high}"
+    elif op == 'compare':
+        text = f"{value[0]} {value[1]}"
+    elif op == 'fuzzy':
+        query, min_score = value if isinstance(value, (list, tuple)) else (value, FUZZY_MIN_SCORE)
+        text = f"{query} (score ≥ {min_score})"
+    else:
+        text = str(value)
+    condition = f"{OPERATORS.get(op, op)} {text}".strip()
+    return f"{filter_item['column']} {condition}" if with_column else condition
+
+
+def filter_key(filters):
+    """Hashable form of a filter chain (cache keys)"""
+    def _freeze(value):
+        if isinstance(value, (list, tuple)):
+            return tuple(_freeze(v) for v in value)
+        return value
+    return tuple(
+        (f['column'], f.get('op', 'equals'), _freeze(f['value'])) for f in filters
+    )
+
+
+def filters_from_key(key):
+    """filter_key() result -> filter chain (cached lookups are keyed on the frozen form)"""
+    return [{'column': column, 'op': op, 'value': value} for column, op, value in key]
+
+
+def apply_filters(index, filters, base=None):
+    """Row set after AND-ing every filter onto base (default: all rows)"""
+    bitmap = full_bitmap(index) if base is None else base
+    for filter_item in filters:
+        bitmap = np.bitwise_and(bitmap, filter_bitmap(index, filter_item))
+    return bitmap
+
+
+def value_counts(index, column, bitmap):
+    """
+    Rows per value of column inside the row set (values with 0 rows and
+    missing values left out). Series indexed by value, in value order.
+    """
+    entry = index['columns'][column]
+    if entry['bitmaps'] is not None:
+        counts = _POPCOUNT[np.bitwise_and(entry['bitmaps'], bitmap)].sum(axis=1, dtype=np.int64)
+    else:
+        codes = entry['codes'][row_positions(index, bitmap)]
+        counts = np.bincount(codes[codes >= 0], minlength=len(entry['values']))
+    series = pd.Series(counts, index=entry['values'], dtype='int64')
+    return series[series > 0]
+
+
+def facet_counts(index, column, bitmap, by_count=False):
+    """
+    Faceted counts for a filter dropdown: non-blank value -> rows it would
+    leave under the current row set. Value order, or most common first.
+    """
+    counts = value_counts(index, column, bitmap)
+    counts = counts[[str(v).strip() != "" for v in counts.index]]
+    if by_count:
+        counts = counts.sort_values(ascending=False, kind='stable')
+    return counts
+
+
+def count_with(index, bitmap, filter_item):
+    """Rows left if filter_item were added to the row set"""
+    return count_rows(np.bitwise_and(bitmap, filter_bitmap(index, filter_item)))
+
+
+def value_range(index, column, bitmap):
+    """(min, max) of a number / date column inside the row set, (None, None) if empty"""
+    present = value_counts(index, column, bitmap).index
+    if pd.api.types.is_datetime64_any_dtype(present.dtype):
+        present = present.dropna()
+        return (present.min(), present.max()) if len(present) else (None, None)
+    numbers = _as_numbers(present)
+    numbers = numbers[~np.isnan(numbers)]
+    return (numbers.min(), numbers.max()) if len(numbers) else (None, None)
+
+
+def select_rows(df, index, bitmap):
+    """The snapshot rows in the row set (a new frame; the snapshot is not copied)"""
+    return df.iloc[row_positions(index, bitmap)]
@@ -0,0 +1,88 @@
+"""
+Filter Inputs Module
+Operator picker + value widget for one Advanced Filtering filter
+Options, ranges and defaults come from the filter_engine index (no frame scans)
+Value dropdowns show faceted counts: rows each value would leave
+"""
+
+import streamlit as st
+
+from filter_engine import FUZZY_MIN_SCORE, column_kind, facet_counts, count_rows, count_with, value_range
+
+OPERATOR_LABELS = {
+    'equals': 'is',
+    'in': 'is any of',
+    'between': 'between',
+    'contains': 'contains',
+    'fuzzy': 'is similar to',
+}
+
+# Operators offered per column kind (first = default)
+KIND_OPERATORS = {
+    'text': ['equals', 'in', 'contains', 'fuzzy'],
+    'number': ['equals', 'in', 'between'],
+    'date': ['between', 'equals', 'in'],
+}
+
+
+def render_filter_input(index, column, row_set, key):
+    """
+    Operator + value widgets for column, plus how many rows the filter would leave.
+    Returns a filter dict {'column', 'op', 'value'}, or None while no value is chosen.
+    """
+    new_filter = _render_value_input(index, column, row_set, key)
+    if new_filter is not None:
+        st.caption(f"→ {count_with(index, row_set, new_filter):,} of {count_rows(row_set):,} rows")
+    return new_filter
+
+
+def _facet_options(index, column, row_set, key):
+    """Dropdown options + 'value (count)' labels from the current row set"""
+    by_count = st.checkbox("Most common first", key=f"{key}_by_count")
+    counts = facet_counts(index, column, row_set, by_count=by_count)
+    return counts.index.tolist(), lambda v: f"{v} ({counts[v]:,})"
+
+
+def _render_value_input(index, column, row_set, key):
+    kind = column_kind(index, column)
+    op = st.selectbox(
+        "Operator",
+        KIND_OPERATORS[kind],
+        format_func=OPERATOR_LABELS.get,
+        key=f"{key}_op",
+    )
+
+    if op == 'equals':
+        options, label = _facet_options(index, column, row_set, key)
+        value = st.selectbox("Select Value", options, format_func=label, key=f"{key}_value")
+        return None if value is None else {'column': column, 'op': op, 'value': value}
+
+    if op == 'in':
+        options, label = _facet_options(index, column, row_set, key)
+        values = st.multiselect("Select Values", options, format_func=label, key=f"{key}_values")
+        return {'column': column, 'op': op, 'value': values} if values else None
+
+    if op == 'between':
+        low, high = value_range(index, column, row_set)
+        if low is None:
+            st.caption("No values in the current results")
+            return None
+        if kind == 'date':
+            picked = st.date_input("Date range", value=(low.date(), high.date()), key=f"{key}_dates")
+            if isinstance(picked, (list, tuple)) and len(picked) == 2:
+                return {'column': column, 'op': op, 'value': (picked[0], picked[1])}
+            return None
+        col_from, col_to = st.columns(2)
+        with col_from:
+            low = st.number_input("From", value=float(low), key=f"{key}_from")
+        with col_to:
+            high = st.number_input("To", value=float(high), key=f"{key}_to")
+        return {'column': column, 'op': op, 'value': (low, high)}
+
+    if op == 'contains':
+        text = st.text_input("Contains", key=f"{key}_contains").strip()
+        return {'column': column, 'op': op, 'value': text} if text else None
+
+    text = st.text_input("Similar to", key=f"{key}_fuzzy").strip()
+    min_score = st.slider("Min similarity", 50, 100, FUZZY_MIN_SCORE, key=f"{key}_score")
+    return {'column': column, 'op': op, 'value': (text, min_score)} if text else None
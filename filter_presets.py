@@ -0,0 +1,117 @@
+"""
+Filter Presets Module
+Named Advanced Filtering presets shared by every user of the app
+Stored in the local report store (one pickle, all datasets)
+The row set of a preset is resolved through the page's cached
+row-set lookup, so opening it within a snapshot is a cache hit
+"""
+
+import copy
+import threading
+from datetime import datetime
+
+import streamlit as st
+
+from filter_engine import describe_filter
+from report_store import load_pickle, save_pickle
+
+PRESETS_FILE = "filter_presets.pkl"
+
+# Read-modify-write of the presets file
+_presets_lock = threading.Lock()
+
+
+def load_presets(dataset):
+    """{name: preset} for one dataset ('candidates' / 'companies')"""
+    return (load_pickle(PRESETS_FILE) or {}).get(dataset, {})
+
+
+def save_preset(dataset, name, filters, user=None, replace_others=False):
+    """
+    Create or overwrite the preset called name. A preset created by another
+    user is only overwritten with replace_others=True. Returns True if saved.
+    """
+    with _presets_lock:
+        presets = load_pickle(PRESETS_FILE) or {}
+        existing = presets.get(dataset, {}).get(name)
+        if existing is not None and existing['created_by'] != (user or "") and not replace_others:
+            return False
+        presets.setdefault(dataset, {})[name] = {
+            'name': name,
+            'filters': copy.deepcopy(filters),
+            'created_by': user or "",
+            'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        save_pickle(presets, PRESETS_FILE)
+    return True
+
+
+def delete_preset(dataset, name):
+    with _presets_lock:
+        presets = load_pickle(PRESETS_FILE) or {}
+        if presets.get(dataset, {}).pop(name, None) is not None:
+            save_pickle(presets, PRESETS_FILE)
+
+
+def render_presets(dataset, filters_key, show_new_key, row_count):
+    """
+    Open / save / delete presets for the filter chain in st.session_state[filters_key].
+    row_count(filters) returns the rows a chain leaves (cached per snapshot).
+    """
+    presets = load_presets(dataset)
+    current = st.session_state[filters_key]
+    user = st.session_state.get('username')
+
+    # Message from the action that triggered the last rerun
+    flash_key = f"{dataset}_preset_flash"
+    if flash_key in st.session_state:
+        st.success(st.session_state.pop(flash_key))
+
+    with st.expander(f"⭐ Saved Filters ({len(presets)})", expanded=False):
+        if presets:
+            names = sorted(presets)
+            col1, col2, col3 = st.columns([3, 1, 1])
+            with col1:
+                name = st.selectbox(
+                    "Preset",
+                    names,
+                    format_func=lambda n: f"{n} ({row_count(presets[n]['filters']):,} rows)",
+                    key=f"{dataset}_preset_pick",
+                )
+            preset = presets[name]
+            with col2:
+                if st.button("📂 Open", key=f"{dataset}_preset_open"):
+                    st.session_state[filters_key] = copy.deepcopy(preset['filters'])
+                    st.session_state[show_new_key] = False
+                    st.rerun()
+            with col3:
+                if st.button("🗑️ Delete", key=f"{dataset}_preset_delete"):
+                    delete_preset(dataset, name)
+                    st.session_state[flash_key] = f"🗑️ Deleted '{name}'"
+                    st.rerun()
+            st.caption(
+                " · ".join(describe_filter(f) for f in preset['filters'])
+                + f" — saved by {preset['created_by'] or 'unknown'} on {preset['created_at']}"
+            )
+        else:
+            st.caption("No saved filters yet")
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            new_name = st.text_input("Save current filters as", key=f"{dataset}_preset_name").strip()
+        owner = presets[new_name]['created_by'] if new_name in presets else None
+        replace_others = False
+        if owner is not None and owner != (user or ""):
+            replace_others = st.checkbox(
+                f"Overwrite '{new_name}' saved by {owner or 'unknown'}", key=f"{dataset}_preset_overwrite"
+            )
+        elif owner is not None:
+            st.caption(f"Replaces your preset '{new_name}'")
+        with col2:
+            blocked = owner is not None and owner != (user or "") and not replace_others
+            if st.button("💾 Save", key=f"{dataset}_preset_save", disabled=not (current and new_name) or blocked):
+                if save_preset(dataset, new_name, current, user, replace_others=replace_others):
+                    st.session_state[flash_key] = f"✅ Saved '{new_name}'"
+                    st.rerun()
+                else:
+                    st.error(f"❌ '{new_name}' was just saved by another user – pick another name")
@@ -0,0 +1,274 @@
+# filter_query.py
+# ====================================================
+# FILTER QUERY LANGUAGE (no Streamlit UI)
+# ====================================================
+# Text queries over a sheet snapshot, compiled onto the filter_engine
+# bitmap index, e.g.
+#
+#   status in (Pending, Hold) and city ~ "indore" and expected_salary <= 18000
+#
+# Grammar (keywords case-insensitive):
+#   query      := or_expr
+#   or_expr    := and_expr ('or' and_expr)*
+#   and_expr   := not_expr ('and' not_expr)*
+#   not_expr   := 'not' not_expr | '(' query ')' | comparison
+#   comparison := field op value | field ['not'] 'in' '(' value (',' value)* ')'
+#   op         := = == != < <= > >= ~ (contains) ~~ (similar to)
+#
+# Fields are column names written snake_case (expected_salary) or quoted in
+# backticks (`Job Location/City`); a few short aliases (city, salary, name)
+# pick the first matching column of the sheet. Values are bare words,
+# numbers, dates or quoted strings. Text equality ignores case and outer
+# spaces; = on a number or date column compares numerically (a bare date
+# means that whole day).
+#
+# parse() gives a syntax tree, compile_query() binds it to one index (columns
+# resolved, text values looked up in the index) and returns a plan of plain
+# filter_engine filters joined by and / or / not. A plan is only valid for
+# the snapshot it was compiled against - cache it per snapshot version.
+# Errors are raised as ValueError with a message fit for the UI.
+
+import re
+
+import numpy as np
+
+from filter_engine import (
+    FUZZY_MIN_SCORE, full_bitmap, empty_bitmap, subtract, filter_bitmap,
+    column_kind, describe_filter,
+)
+
+
+# Short field names -> candidate columns, first one present in the sheet wins
+FIELD_ALIASES = {
+    'city': ['Current City', 'Job Location/City', 'City'],
+    'location': ['Preferred Location', 'Job Location/City', 'Location', 'City'],
+    'salary': ['Expected Salary', 'Salary'],
+    'name': ['Full Name', 'Company Name'],
+    'company': ['Company Name'],
+    'job': ['Job Title'],
+    'title': ['Job Title'],
+    'phone': ['Mobile'],
+}
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<field>`[^`]+`)
+      | (?P<op>==|!=|<=|>=|~~|[=<>~(),])
+      | (?P<word>[^\s"'`=!<>~(),]+)
+    )""", re.VERBOSE)
+
+_KEYWORDS = {'and', 'or', 'not', 'in'}
+
+
+def _tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            pos += len(text[pos:]) - len(text[pos:].lstrip())
+            raise ValueError(f"Unexpected character at position {pos + 1}: {text[pos:pos + 10]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        start = match.start(kind)
+        if kind == 'string':
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == 'field':
+            value = value[1:-1].strip()
+        elif kind == 'word' and value.lower() in _KEYWORDS:
+            kind, value = 'keyword', value.lower()
+        tokens.append((kind, value, start))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def peek(self, kind=None, value=None):
+        if self.pos >= len(self.tokens):
+            return None
+        token = self.tokens[self.pos]
+        if (kind and token[0] != kind) or (value and token[1] != value):
+            return None
+        return token
+
+    def take(self, kind=None, value=None, expected=None):
+        token = self.peek(kind, value)
+        if token is None:
+            where = (f"at position {self.tokens[self.pos][2] + 1}"
+                     if self.pos < len(self.tokens) else "at the end of the query")
+            raise ValueError(f"Expected {expected or value or kind} {where}")
+        self.pos += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Empty query")
+        tree = self.or_expr()
+        if self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            raise ValueError(f"Unexpected {token[1]!r} at position {token[2] + 1}")
+        return tree
+
+    def or_expr(self):
+        parts = [self.and_expr()]
+        while self.peek('keyword', 'or'):
+            self.pos += 1
+            parts.append(self.and_expr())
+        return parts[0] if len(parts) == 1 else ('or', parts)
+
+    def and_expr(self):
+        parts = [self.not_expr()]
+        while self.peek('keyword', 'and'):
+            self.pos += 1
+            parts.append(self.not_expr())
+        return parts[0] if len(parts) == 1 else ('and', parts)
+
+    def not_expr(self):
+        if self.peek('keyword', 'not'):
+            self.pos += 1
+            return ('not', self.not_expr())
+        if self.peek('op', '('):
+            self.pos += 1
+            tree = self.or_expr()
+            self.take('op', ')', expected="')'")
+            return tree
+        return self.comparison()
+
+    def value(self):
+        token = self.peek('string') or self.peek('word')
+        if token is None:
+            self.take(expected="a value")
+        self.pos += 1
+        return token[1]
+
+    def comparison(self):
+        token = self.peek('field') or self.peek('word')
+        if token is None:
+            self.take(expected="a field name")
+        self.pos += 1
+        field = token[1]
+
+        negate = False
+        if self.peek('keyword', 'not'):
+            self.pos += 1
+            negate = True
+            self.take('keyword', 'in', expected="'in' after 'not'")
+            op = 'in'
+        elif self.peek('keyword', 'in'):
+            self.pos += 1
+            op = 'in'
+        else:
+            op = self.take('op', expected="a comparison operator")[1]
+            if op in ('(', ')', ','):
+                raise ValueError(f"Expected a comparison operator after {field!r}")
+
+        if op == 'in':
+            self.take('op', '(', expected="'(' after 'in'")
+            values = [self.value()]
+            while self.peek('op', ','):
+                self.pos += 1
+                values.append(self.value())
+            self.take('op', ')', expected="')'")
+        else:
+            values = [self.value()]
+
+        if op == '!=':
+            op, negate = '=', True
+        elif op == '==':
+            op = '='
+        leaf = ('cmp', field, op, tuple(values))
+        return ('not', leaf) if negate else leaf
+
+
+def parse(text):
+    """Query text -> syntax tree; ValueError on a syntax error"""
+    return _Parser(str(text)).parse()
+
+
+def _normalize(name):
+    return re.sub(r"[^a-z0-9]+", "_", str(name).lower()).strip("_")
+
+
+def resolve_field(index, field):
+    """Column of the index a query field refers to"""
+    columns = index['columns']
+    if field in columns:
+        return field
+    key = _normalize(field)
+    for column in columns:
+        if _normalize(column) == key:
+            return column
+    for column in FIELD_ALIASES.get(key, []):
+        if column in columns:
+            return column
+    raise ValueError(f"Unknown field '{field}'")
+
+
+def _equals_filters(index, column, values):
+    """Filters for column = any of values (text: case-insensitive, number / date: numeric)"""
+    kind = column_kind(index, column)
+    if kind == 'text':
+        wanted = {str(v).strip().lower() for v in values}
+        present = index['columns'][column]['values']
+        matches = [v for v in present if str(v).strip().lower() in wanted]
+        return [{'column': column, 'op': 'in', 'value': matches}]
+    return [{'column': column, 'op': 'between', 'value': (v, v)} for v in values]
+
+
+def _bind(tree, index):
+    kind = tree[0]
+    if kind in ('and', 'or'):
+        return (kind, [_bind(part, index) for part in tree[1]])
+    if kind == 'not':
+        return ('not', _bind(tree[1], index))
+
+    _, field, op, values = tree
+    column = resolve_field(index, field)
+    if op in ('=', 'in'):
+        filters = _equals_filters(index, column, values)
+        leaves = [('filter', f) for f in filters]
+        return leaves[0] if len(leaves) == 1 else ('or', leaves)
+    value = values[0]
+    if op in ('<', '<=', '>', '>='):
+        return ('filter', {'column': column, 'op': 'compare', 'value': (op, value)})
+    if op == '~':
+        return ('filter', {'column': column, 'op': 'contains', 'value': value})
+    if op == '~~':
+        return ('filter', {'column': column, 'op': 'fuzzy', 'value': (value, FUZZY_MIN_SCORE)})
+    raise ValueError(f"Unsupported operator {op!r}")
+
+
+def compile_query(text, index):
+    """Query text -> plan bound to index; ValueError on syntax / field / value errors"""
+    plan = _bind(parse(text), index)
+    # Surface bad numbers / dates now rather than on first evaluation
+    evaluate(plan, index)
+    return plan
+
+
+def evaluate(plan, index, base=None):
+    """Row set of a compiled plan (AND-ed onto base if given)"""
+    kind = plan[0]
+    if kind == 'filter':
+        try:
+            bitmap = filter_bitmap(index, plan[1])
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Bad value in '{describe_filter(plan[1])}': {e}") from e
+    elif kind == 'and':
+        bitmap = full_bitmap(index)
+        for part in plan[1]:
+            bitmap = np.bitwise_and(bitmap, evaluate(part, index))
+    elif kind == 'or':
+        bitmap = empty_bitmap(index)
+        for part in plan[1]:
+            bitmap = np.bitwise_or(bitmap, evaluate(part, index))
+    else:
+        bitmap = subtract(full_bitmap(index), evaluate(plan[1], index))
+    return bitmap if base is None else np.bitwise_and(base, bitmap)
@@ -0,0 +1,209 @@
+# funnel_analytics.py
+# ====================================================
+# PLACEMENT FUNNEL + STAGE LATENCY (no Streamlit UI)
+# ====================================================
+# One row per Interview_Records entry with the timestamp of every funnel
+# stage, joined once per snapshot with Candidates (registration), Sheet4
+# (job city) and CID (industry). Stage timestamps come from the
+# Interview_Events log where available, with sheet columns as fallback for
+# records that pre-date the log. Latencies and percentiles are vectorized.
+
+import pandas as pd
+
+
+STAGES = ['Registered', 'Matched', 'Scheduled', 'Completed', 'Selected', 'Joined']
+
+# (from stage, to stage) pairs reported as latencies
+TRANSITIONS = list(zip(STAGES[:-1], STAGES[1:]))
+
+# Dimensions the latency report can be grouped by -> funnel column
+DIMENSIONS = {'Recruiter': 'Recruiter', 'Industry': 'Industry', 'City': 'City'}
+
+PERCENTILES = (0.5, 0.75, 0.9)
+
+UNKNOWN = 'Unknown'
+
+
+def transition_label(from_stage, to_stage):
+    return f"{from_stage} → {to_stage}"
+
+
+def _as_datetime(df, column):
+    if column not in df.columns:
+        return pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+    return pd.to_datetime(df[column], errors='coerce')
+
+
+def _lookup(keys, table, key_column, value_column):
+    """Map keys through table[key_column] -> table[value_column] (first row per key wins)"""
+    if len(table) == 0 or key_column not in table.columns or value_column not in table.columns:
+        return pd.Series(pd.NA, index=keys.index)
+    mapping = table.drop_duplicates(key_column).set_index(key_column)[value_column]
+    return keys.map(mapping)
+
+
+def _dimension(values):
+    text = values.astype('string').str.strip()
+    return text.mask(text.isna() | (text == ""), UNKNOWN)
+
+
+def _first_event_times(events_df):
+    """
+    Earliest event timestamp per record for each event-backed stage.
+    Returns DataFrame indexed by Record ID with Scheduled / Completed /
+    Selected / Recruiter columns.
+    """
+    columns = ['Scheduled', 'Completed', 'Selected', 'Recruiter']
+    if events_df is None or len(events_df) == 0 or 'To Status' not in events_df.columns:
+        return pd.DataFrame(columns=columns)
+
+    events = events_df.assign(
+        _ts=pd.to_datetime(events_df['Timestamp'], errors='coerce'),
+        _rid=events_df['Record ID'].astype(str).str.strip(),
+    )
+    # To Status is "Interview Status / Result Status"
+    parts = events['To Status'].astype(str).str.split(' / ', n=1, expand=True).reindex(columns=[0, 1])
+    interview_part = parts[0].fillna("").str.strip()
+    result_part = parts[1].fillna("").str.strip()
+
+    stage_masks = {
+        'Scheduled': interview_part.isin(['Interview Scheduled', 'Rescheduled']),
+        'Completed': interview_part == 'Interview Completed',
+        'Selected': result_part == 'Selected',
+    }
+    first = pd.DataFrame({
+        stage: events.loc[mask].groupby('_rid')['_ts'].min()
+        for stage, mask in stage_masks.items()
+    })
+
+    # Recruiter = whoever logged the first scheduling event
+    scheduled = events.loc[stage_masks['Scheduled']].sort_values('_ts', kind='stable')
+    first['Recruiter'] = scheduled.drop_duplicates('_rid').set_index('_rid')['Actor']
+    return first.reindex(columns=columns)
+
+
+def build_funnel(candidates_df, interviews_df, vacancies_df, companies_df=None, events_df=None):
+    """
+    Build the per-record funnel table.
+
+    Returns DataFrame with Record ID, Candidate ID, CID, Job Title, the
+    dimension columns (Recruiter, Industry, City), one datetime column per
+    stage in STAGES and one latency column (days) per TRANSITIONS pair.
+    """
+    label_columns = [transition_label(a, b) for a, b in TRANSITIONS]
+    if len(interviews_df) == 0 or 'Record ID' not in interviews_df.columns:
+        return pd.DataFrame(columns=['Record ID', 'Candidate ID', 'CID', 'Job Title']
+                            + list(DIMENSIONS.values()) + STAGES + label_columns)
+
+    records = interviews_df
+    funnel = pd.DataFrame({
+        'Record ID': records['Record ID'].astype(str).str.strip(),
+        'Candidate ID': records.get('Candidate ID', pd.Series("", index=records.index)).astype(str).str.strip(),
+        'CID': records.get('CID', pd.Series("", index=records.index)).astype(str).str.strip(),
+        'Job Title': records.get('Job Title', pd.Series("", index=records.index)).astype(str).str.strip(),
+    })
+    interview_status = records.get('Interview Status', pd.Series("", index=records.index)).astype(str).str.strip()
+    result_status = records.get('Result Status', pd.Series("", index=records.index)).astype(str).str.strip()
+
+    # --- Registration (Candidates) ---
+    if len(candidates_df) > 0 and 'Candidate ID' in candidates_df.columns:
+        registrations = pd.DataFrame({
+            'Candidate ID': candidates_df['Candidate ID'].astype(str).str.strip(),
+            'Registered': _as_datetime(candidates_df, 'Date Applied'),
+        })
+        funnel['Registered'] = _lookup(funnel['Candidate ID'], registrations, 'Candidate ID', 'Registered')
+    else:
+        funnel['Registered'] = pd.NaT
+    funnel['Registered'] = pd.to_datetime(funnel['Registered'], errors='coerce')
+
+    # --- Match (record creation) ---
+    funnel['Matched'] = _as_datetime(records, 'Date Created')
+
+    # --- Event-backed stages, with sheet fallbacks for legacy records ---
+    first = _first_event_times(events_df)
+    for stage in ['Scheduled', 'Completed', 'Selected']:
+        funnel[stage] = pd.to_datetime(funnel['Record ID'].map(first[stage]), errors='coerce')
+
+    interview_date = _as_datetime(records, 'Interview Date')
+    done = interview_status.eq('Interview Completed') | result_status.isin(['Selected', 'Rejected'])
+    funnel['Completed'] = funnel['Completed'].fillna(interview_date.where(done))
+    funnel['Selected'] = funnel['Selected'].fillna(
+        _as_datetime(records, 'Last Updated').where(result_status.eq('Selected'))
+    )
+    funnel['Joined'] = _as_datetime(records, 'Joining Date').where(funnel['Selected'].notna())
+
+    # --- Dimensions ---
+    recruiter = funnel['Record ID'].map(first['Recruiter'])
+    if 'Updated By' in records.columns:
+        recruiter = recruiter.fillna(records['Updated By'].where(interview_status.ne('Matched')))
+    funnel['Recruiter'] = _dimension(recruiter)
+
+    industry = pd.Series(pd.NA, index=funnel.index)
+    if companies_df is not None and len(companies_df) > 0 and 'CID' in companies_df.columns:
+        companies = companies_df.assign(CID=companies_df['CID'].astype(str).str.strip())
+        industry = _lookup(funnel['CID'], companies, 'CID', 'Industry')
+    funnel['Industry'] = _dimension(industry)
+
+    city = pd.Series(pd.NA, index=funnel.index)
+    if len(vacancies_df) > 0 and {'CID', 'Job Title', 'Job Location/City'} <= set(vacancies_df.columns):
+        vacancies = pd.DataFrame({
+            '_key': vacancies_df['CID'].astype(str).str.strip() + '|' + vacancies_df['Job Title'].astype(str).str.strip(),
+            'City': vacancies_df['Job Location/City'],
+        })
+        city = _lookup(funnel['CID'] + '|' + funnel['Job Title'], vacancies, '_key', 'City')
+    funnel['City'] = _dimension(city)
+
+    # --- Latencies (days); negative gaps are data errors and dropped ---
+    for (a, b), label in zip(TRANSITIONS, label_columns):
+        days = (funnel[b] - funnel[a]) / pd.Timedelta(days=1)
+        funnel[label] = days.where(days >= 0)
+
+    return funnel
+
+
+def funnel_counts(funnel):
+    """Number of records that reached each stage (Series in STAGES order)"""
+    if len(funnel) == 0:
+        return pd.Series(0, index=pd.Index(STAGES, name='Stage'), dtype='int64')
+    counts = funnel[STAGES].notna().sum()
+    counts.index.name = 'Stage'
+    return counts
+
+
+def latency_percentiles(funnel, by=None, percentiles=PERCENTILES):
+    """
+    Percentile latency (days) per transition, optionally per dimension.
+
+    Args:
+        funnel: build_funnel() result
+        by: None for overall, or a DIMENSIONS key ('Recruiter', 'Industry', 'City')
+
+    Returns long DataFrame: [<by>], Transition, Count, P50, P75, P90 ...
+    """
+    labels = [transition_label(a, b) for a, b in TRANSITIONS]
+    pct_columns = [f"P{int(p * 100)}" for p in percentiles]
+    group_columns = [DIMENSIONS[by]] if by else []
+    empty = pd.DataFrame(columns=group_columns + ['Transition', 'Count'] + pct_columns)
+    if len(funnel) == 0:
+        return empty
+
+    long = funnel.melt(
+        id_vars=group_columns, value_vars=labels, var_name='Transition', value_name='Days'
+    ).dropna(subset=['Days'])
+    if len(long) == 0:
+        # no record has reached two stages yet
+        return empty
+    keys = group_columns + ['Transition']
+    grouped = long.groupby(keys, sort=False)['Days']
+
+    stats = grouped.quantile(list(percentiles)).unstack()
+    stats.columns = pct_columns
+    stats.insert(0, 'Count', grouped.size())
+    stats = stats.reset_index()
+
+    # Transition in funnel order inside each group
+    stats['Transition'] = pd.Categorical(stats['Transition'], categories=labels, ordered=True)
+    stats = stats.sort_values(keys).reset_index(drop=True)
+    stats['Transition'] = stats['Transition'].astype(str)
+    stats[pct_columns] = stats[pct_columns].round(1)
+    return stats
@@ -0,0 +1,111 @@
+"""
+Interview Events Module
+Append-only Interview_Events log - one compact row per status transition
+Replaces appending every feedback to the Remarks cell of Interview_Records
+"""
+
+import logging
+
+import gspread
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+EVENTS_SHEET = "Interview_Events"
+EVENT_HEADERS = ["Record ID", "Timestamp", "Actor", "From Status", "To Status", "Note"]
+
+
+def status_label(interview_status, result_status):
+    """Compact status used in From/To Status: 'Interview Status / Result Status'"""
+    interview_status = str(interview_status or "").strip()
+    result_status = str(result_status or "").strip()
+    return f"{interview_status} / {result_status}" if result_status else interview_status
+
+
+def make_event(record_id, actor, from_status, to_status, note="", timestamp=None):
+    """Build one event row (list in EVENT_HEADERS order)"""
+    if timestamp is None:
+        timestamp = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+    return [
+        str(record_id).strip(),
+        timestamp,
+        str(actor or "System"),
+        str(from_status or ""),
+        str(to_status or ""),
+        str(note or "").strip(),
+    ]
+
+
+def get_events_sheet(spreadsheet):
+    """Open Interview_Events, creating it with headers on first use"""
+    try:
+        return spreadsheet.worksheet(EVENTS_SHEET)
+    except gspread.exceptions.WorksheetNotFound:
+        logger.info(f"Creating {EVENTS_SHEET} worksheet")
+        worksheet = spreadsheet.add_worksheet(
+            title=EVENTS_SHEET, rows=1000, cols=len(EVENT_HEADERS)
+        )
+        worksheet.append_row(EVENT_HEADERS)
+        return worksheet
+
+
+def append_events(spreadsheet, events):
+    """
+    Write a batch of events with a single append_rows call.
+    Returns True on success (or nothing to write).
+    """
+    if not events:
+        return True
+    try:
+        worksheet = get_events_sheet(spreadsheet)
+        worksheet.append_rows(events, value_input_option='RAW')
+        logger.info(f"Appended {len(events)} interview events")
+        return True
+    except Exception as e:
+        logger.error(f"Error appending interview events: {e}")
+        return False
+
+
+def load_events(spreadsheet):
+    """Read the whole event log as a DataFrame (empty frame if the sheet does not exist yet)"""
+    try:
+        worksheet = spreadsheet.worksheet(EVENTS_SHEET)
+    except gspread.exceptions.WorksheetNotFound:
+        return pd.DataFrame(columns=EVENT_HEADERS)
+
+    data = worksheet.get_all_values()
+    if len(data) <= 1:
+        return pd.DataFrame(columns=EVENT_HEADERS)
+    return pd.DataFrame(data[1:], columns=data[0])
+
+
+def build_history_index(events_df):
+    """
+    Group the event log by record once.
+    Returns {record_id: DataFrame of that record's events, oldest first}
+    """
+    if events_df is None or len(events_df) == 0 or 'Record ID' not in events_df.columns:
+        return {}
+
+    events = events_df.assign(
+        _ts=pd.to_datetime(events_df['Timestamp'], errors='coerce')
+    ).sort_values('_ts', kind='stable')
+    return {
+        str(rid): group.drop(columns='_ts').reset_index(drop=True)
+        for rid, group in events.groupby('Record ID', sort=False)
+    }
+
+
+def format_history(history_df, legacy_remarks=""):
+    """Render one record's history as text lines (legacy Remarks text first)"""
+    lines = []
+    if str(legacy_remarks or "").strip():
+        lines.append(str(legacy_remarks).strip())
+    if history_df is None:
+        return lines
+    for _, event in history_df.iterrows():
+        line = f"[{event['Timestamp']}] {event['Actor']}: {event['From Status']} → {event['To Status']}"
+        if str(event.get('Note', "")).strip():
+            line += f" — {event['Note']}"
+        lines.append(line)
+    return lines
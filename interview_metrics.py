@@ -0,0 +1,83 @@
+# interview_metrics.py
+# ====================================================
+# INTERVIEW DASHBOARD METRICS (no Streamlit UI)
+# ====================================================
+# All status counts, today's list and the pending list computed in one go per
+# Interview_Records snapshot, instead of one boolean mask per metric on every
+# rerun. app.py memoizes the result on the snapshot version.
+
+import pandas as pd
+
+
+TODAY_COLUMNS = ['Record ID', 'Full Name', 'Company Name', 'Job Title', 'Interview Time']
+PENDING_COLUMNS = ['Record ID', 'Full Name', 'Company Name', 'Job Title', 'Match Score']
+
+
+def interview_dates(interviews_df):
+    """Interview Date as normalized datetimes (NaT when missing/unparseable)"""
+    dates = interviews_df['Interview Date']
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates.dt.normalize()
+    # Schedule form writes '%Y-%m-%d'; anything after the date part is ignored
+    return pd.to_datetime(dates.astype(str).str.slice(0, 10), format='%Y-%m-%d', errors='coerce')
+
+
+def compute_interview_metrics(interviews_df, today=None):
+    """
+    Compute every dashboard number from one snapshot.
+
+    Returns dict:
+        total                   - number of records
+        interview_status_counts - Series: Interview Status -> count
+        result_status_counts    - Series: Result Status -> count
+        matched / scheduled / completed / selected - ints for the metric cards
+        today                   - DataFrame of interviews scheduled today
+        pending                 - DataFrame of 'Matched' records waiting to be scheduled
+    """
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    empty = pd.Series(dtype='int64')
+    metrics = {
+        'total': len(interviews_df),
+        'interview_status_counts': empty,
+        'result_status_counts': empty,
+        'matched': 0, 'scheduled': 0, 'completed': 0, 'selected': 0,
+        'today': pd.DataFrame(columns=TODAY_COLUMNS),
+        'pending': pd.DataFrame(columns=PENDING_COLUMNS),
+    }
+    if len(interviews_df) == 0:
+        return metrics
+
+    interview_status = (
+        interviews_df['Interview Status'] if 'Interview Status' in interviews_df.columns
+        else pd.Series("", index=interviews_df.index)
+    )
+    result_status = (
+        interviews_df['Result Status'] if 'Result Status' in interviews_df.columns
+        else pd.Series("", index=interviews_df.index)
+    )
+
+    # Single grouped pass -> both marginals
+    crosstab = pd.DataFrame({'i': interview_status.astype(str), 'r': result_status.astype(str)}).value_counts()
+    by_interview = crosstab.groupby(level='i').sum().sort_values(ascending=False)
+    by_result = crosstab.groupby(level='r').sum().sort_values(ascending=False)
+    by_interview.index.name = 'Interview Status'
+    by_result.index.name = 'Result Status'
+
+    metrics['interview_status_counts'] = by_interview
+    metrics['result_status_counts'] = by_result
+    metrics['matched'] = int(by_interview.get('Matched', 0))
+    metrics['scheduled'] = int(by_interview.get('Interview Scheduled', 0))
+    metrics['completed'] = int(by_interview.get('Interview Completed', 0))
+    metrics['selected'] = int(by_result.get('Selected', 0))
+
+    if 'Interview Date' in interviews_df.columns:
+        is_today = (interview_status == 'Interview Scheduled') & (interview_dates(interviews_df) == today)
+        metrics['today'] = interviews_df.loc[
+            is_today, [c for c in TODAY_COLUMNS if c in interviews_df.columns]
+        ].reset_index(drop=True)
+
+    metrics['pending'] = interviews_df.loc[
+        interview_status == 'Matched', [c for c in PENDING_COLUMNS if c in interviews_df.columns]
+    ].reset_index(drop=True)
+
+    return metrics
@@ -0,0 +1,191 @@
+# interview_slots.py
+# ====================================================
+# INTERVIEW SLOT INDEX + CALENDAR (no Streamlit UI)
+# ====================================================
+# Interval index over scheduled interviews, keyed by candidate, vacancy
+# (CID + Job Title), interviewer and company (CID). Built once per data
+# snapshot; overlap queries are a bisect on the sorted start times of one key
+# instead of a DataFrame scan.
+#
+# Candidate, vacancy and interviewer overlaps are clashes (HARD_CONFLICTS).
+# Other interviews at the same company only mean the company is busy - it may
+# run parallel panels - so they are reported separately as a soft warning.
+
+import re
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+
+import pandas as pd
+
+
+# Interviews have no end time in the sheet – every slot is assumed to last this long
+SLOT_MINUTES = 60
+
+# Statuses that occupy a slot
+ACTIVE_SLOT_STATUSES = ['Interview Scheduled', 'Rescheduled']
+
+# find_conflicts kinds that block scheduling ('company' is informational)
+HARD_CONFLICTS = ('candidate', 'vacancy', 'interviewer')
+
+# Schedule form writes: "Mode: X | Location/Link: Y | Interviewer: Z | remarks"
+_INTERVIEWER_RE = re.compile(r'Interviewer:\s*([^|\n]*)')
+
+
+def _norm_key(value):
+    return str(value).strip().lower()
+
+
+def vacancy_key(company_id, job_title):
+    """One vacancy = company (CID) + job title; empty without a CID"""
+    company_id = _norm_key(company_id)
+    return f"{company_id}|{_norm_key(job_title)}" if company_id else ""
+
+
+def parse_interviewer(remarks):
+    """Extract interviewer name from the Remarks text written by the schedule form"""
+    match = _INTERVIEWER_RE.search(str(remarks or ""))
+    return match.group(1).strip() if match else ""
+
+
+def slot_starts(interviews_df):
+    """Vectorized start timestamps from Interview Date + Interview Time (NaT if unparseable)"""
+    dates = pd.to_datetime(interviews_df['Interview Date'], errors='coerce').dt.normalize()
+    if 'Interview Time' in interviews_df.columns:
+        times = interviews_df['Interview Time'].astype(str).str.strip().str.slice(0, 5)
+        offsets = pd.to_timedelta(times + ':00', errors='coerce').fillna(pd.Timedelta(0))
+    else:
+        offsets = pd.Timedelta(0)
+    return dates + offsets
+
+
+def build_slot_index(interviews_df, slot_minutes=SLOT_MINUTES):
+    """
+    Build the slot index from the Interview_Records snapshot.
+
+    Returns dict:
+        slots      - DataFrame of active slots sorted by start
+        by_key     - {(kind, key): (starts, record_ids)} with starts sorted;
+                     kind is 'candidate', 'vacancy', 'interviewer' or 'company'
+        by_day     - {date: DataFrame of that day's slots}
+        duration   - slot length (timedelta)
+    """
+    duration = timedelta(minutes=slot_minutes)
+    index = {'slots': pd.DataFrame(), 'by_key': {}, 'by_day': {}, 'duration': duration}
+
+    if len(interviews_df) == 0 or 'Interview Date' not in interviews_df.columns:
+        return index
+
+    df = interviews_df
+    if 'Interview Status' in df.columns:
+        df = df[df['Interview Status'].astype(str).str.strip().isin(ACTIVE_SLOT_STATUSES)]
+
+    cols = [c for c in ['Record ID', 'Candidate ID', 'Full Name', 'Company Name', 'CID',
+                        'Job Title', 'Interview Round', 'Interview Status'] if c in df.columns]
+    slots = df[cols].copy()
+    slots['Start'] = slot_starts(df)
+    slots['Interviewer'] = (
+        df['Remarks'].map(parse_interviewer) if 'Remarks' in df.columns else ""
+    )
+    if 'CID' in df.columns:
+        titles = df['Job Title'] if 'Job Title' in df.columns else pd.Series("", index=df.index)
+        slots['Vacancy'] = [vacancy_key(cid, title) for cid, title in zip(df['CID'], titles)]
+    slots = slots[slots['Start'].notna()].sort_values('Start').reset_index(drop=True)
+    slots['End'] = slots['Start'] + duration
+    index['slots'] = slots
+
+    key_columns = {'candidate': 'Candidate ID', 'vacancy': 'Vacancy', 'interviewer': 'Interviewer', 'company': 'CID'}
+    starts = slots['Start'].tolist()
+    record_ids = slots['Record ID'].astype(str).tolist() if 'Record ID' in slots.columns else [""] * len(slots)
+
+    for kind, column in key_columns.items():
+        if column not in slots.columns:
+            continue
+        # slots are already sorted by start, so each group keeps sorted order
+        for pos, key in enumerate(slots[column].map(_norm_key)):
+            if not key:
+                continue
+            bucket = index['by_key'].setdefault((kind, key), ([], []))
+            bucket[0].append(starts[pos])
+            bucket[1].append(record_ids[pos])
+
+    for day, day_slots in slots.groupby(slots['Start'].dt.date):
+        index['by_day'][day] = day_slots.reset_index(drop=True)
+
+    return index
+
+
+def find_overlaps(index, kind, key, start, exclude_record=None):
+    """Record IDs of slots for (kind, key) overlapping [start, start + duration)"""
+    key = _norm_key(key)
+    if not key or (kind, key) not in index['by_key']:
+        return []
+
+    starts, record_ids = index['by_key'][(kind, key)]
+    duration = index['duration']
+    start = pd.Timestamp(start)
+
+    # Fixed-length slots overlap iff the other start lies in (start - duration, start + duration)
+    lo = bisect_right(starts, start - duration)
+    hi = bisect_left(starts, start + duration)
+    return [rid for rid in record_ids[lo:hi] if rid != exclude_record]
+
+
+def find_conflicts(index, start, candidate_id="", company_id="", interviewer="", job_title="",
+                   exclude_record=None):
+    """
+    Check a proposed slot against the index.
+    Returns {'candidate', 'vacancy', 'interviewer', 'company'} -> overlapping
+    record ids. Only HARD_CONFLICTS are clashes; 'company' lists the other
+    interviews the company has at that time (not already a vacancy or
+    interviewer clash).
+    """
+    conflicts = {
+        'candidate': find_overlaps(index, 'candidate', candidate_id, start, exclude_record),
+        'vacancy': find_overlaps(index, 'vacancy', vacancy_key(company_id, job_title), start, exclude_record),
+        'interviewer': find_overlaps(index, 'interviewer', interviewer, start, exclude_record),
+    }
+    counted = set(conflicts['vacancy']) | set(conflicts['interviewer'])
+    conflicts['company'] = [
+        rid for rid in find_overlaps(index, 'company', company_id, start, exclude_record) if rid not in counted
+    ]
+    return conflicts
+
+
+def day_schedule(index, day):
+    """Slots on one date (DataFrame, sorted by time)"""
+    return index['by_day'].get(day, pd.DataFrame())
+
+
+def week_calendar(index, week_start):
+    """
+    Time x weekday grid for the 7 days from week_start.
+    Each cell lists "Full Name → Company Name" for that slot.
+    """
+    days = [week_start + timedelta(days=i) for i in range(7)]
+    frames = []
+    for day in days:
+        day_slots = index['by_day'].get(day)
+        if day_slots is None or len(day_slots) == 0:
+            continue
+        cell = day_slots.get('Full Name', pd.Series("", index=day_slots.index)).astype(str)
+        if 'Company Name' in day_slots.columns:
+            cell = cell + " → " + day_slots['Company Name'].astype(str)
+        frames.append(pd.DataFrame({
+            'Time': day_slots['Start'].dt.strftime('%H:%M'),
+            'Day': day.strftime('%a %d-%b'),
+            'Slot': cell,
+        }))
+
+    columns = [d.strftime('%a %d-%b') for d in days]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+
+    grid = (
+        pd.concat(frames)
+        .groupby(['Time', 'Day'])['Slot']
+        .agg('\n'.join)
+        .unstack('Day')
+        .reindex(columns=columns)
+        .fillna("")
+    )
+    return grid
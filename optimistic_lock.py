@@ -0,0 +1,116 @@
+"""
+Optimistic Lock Module
+Compare-and-set for Interview_Records row updates
+Re-reads only the target row and checks 'Last Updated' before batch_update
+"""
+
+import logging
+
+import pandas as pd
+
+from sheet_ingest import parse_dates
+
+logger = logging.getLogger(__name__)
+
+VERSION_COLUMN = "Last Updated"
+
+
+def normalize_stamp(value):
+    """
+    Canonical form of a Last Updated value so snapshot and sheet values compare
+    equal. Text is parsed exactly as sheet_ingest parsed the snapshot
+    (DATE_FORMATS); None if the value is empty or does not parse.
+    """
+    if value is None:
+        return None
+    if not hasattr(value, 'strftime'):
+        value = parse_dates([value]).iloc[0]
+    if pd.isna(value):
+        return None
+    return pd.Timestamp(value).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def stamps_match(current, expected):
+    """
+    True if the sheet's Last Updated (current, raw text) is still the value
+    the user's snapshot had (expected). A typed snapshot holds NaT for a
+    stamp that did not parse, i.e. its version is unknown: the row counts as
+    unchanged while the sheet's stamp still does not parse - an update made
+    by the app always writes a parseable one. Expected raw text that does not
+    parse is compared as text.
+    """
+    found = normalize_stamp(current)
+    wanted = normalize_stamp(expected)
+    if found is not None or wanted is not None:
+        return found == wanted
+    if isinstance(expected, str):
+        return str(current or "").strip() == expected.strip()
+    return True
+
+
+def locate_record(sheet, record_id):
+    """
+    Find a record's sheet row with one small read (header row + Record ID column A).
+    Returns (headers, row_number) - row_number is None if not found.
+    """
+    header_range, id_range = sheet.batch_get(['1:1', 'A:A'])
+    headers = header_range[0] if header_range else []
+
+    for row_num, cells in enumerate(id_range[1:], start=2):
+        if cells and str(cells[0]).strip() == str(record_id).strip():
+            return headers, row_num
+    return headers, None
+
+
+def check_row_version(headers, current_row, expected_version):
+    """
+    Compare the row's current Last Updated with the value the user's snapshot had.
+
+    Returns (ok, current) - current is a dict with the row's Last Updated / Updated By.
+    A sheet without a Last Updated column is never treated as a conflict.
+    """
+    row = list(current_row) + [""] * (len(headers) - len(current_row))
+    current = {
+        'last_updated': row[headers.index(VERSION_COLUMN)] if VERSION_COLUMN in headers else "",
+        'updated_by': row[headers.index('Updated By')] if 'Updated By' in headers else "",
+    }
+    if VERSION_COLUMN not in headers:
+        return True, current
+
+    ok = stamps_match(current['last_updated'], expected_version)
+    if not ok:
+        logger.warning(
+            f"Row version conflict: expected '{expected_version}', found '{current['last_updated']}'"
+        )
+    return ok, current
+
+
+def read_row_for_update(sheet, record_id, expected_version):
+    """
+    Locate the record and re-read just that row to verify nobody changed it
+    since the snapshot was taken.
+
+    Returns dict:
+        headers, row_num, row   - current sheet data (row_num None if not found)
+        ok                      - True if the row can be written
+        current                 - {'last_updated', 'updated_by'} from the sheet
+    """
+    headers, row_num = locate_record(sheet, record_id)
+    result = {'headers': headers, 'row_num': row_num, 'row': [], 'ok': False, 'current': {}}
+    if row_num is None:
+        return result
+
+    row = sheet.row_values(row_num)
+    ok, current = check_row_version(headers, row, expected_version)
+    result.update({'row': row, 'ok': ok, 'current': current})
+    return result
+
+
+def conflict_message(current):
+    """User-facing text for a version conflict"""
+    who = current.get('updated_by') or "someone else"
+    when = current.get('last_updated') or "recently"
+    return (
+        f"⚠️ This record was changed by **{who}** at **{when}** after your data was loaded. "
+        "Your update was NOT saved – refresh the data and try again."
+    )
@@ -0,0 +1,118 @@
+"""
+Paged Table Module
+Server-side search / sort / pagination for large sheet frames
+Only the visible page and the chosen columns are sent to the browser;
+the search + sort result (row positions) is cached on the frame's own
+snapshot token (sheet_ingest.snapshot_version), so a cached order is only
+ever applied to the fetch it was computed from
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from sheet_ingest import snapshot_version
+
+PAGE_SIZES = [25, 50, 100, 200]
+
+# Columns shown until the user picks their own
+DEFAULT_VISIBLE_COLUMNS = 12
+
+_SHEET_ORDER = "(sheet order)"
+
+
+def _search_mask(df, columns, query):
+    """Rows where any of columns contains query (case-insensitive) - tested once per distinct value"""
+    mask = np.zeros(len(df), dtype=bool)
+    for column in columns:
+        codes, uniques = pd.factorize(df[column])
+        hits = pd.Index(uniques).astype(str).str.contains(query, case=False, regex=False)
+        hits = np.append(np.asarray(hits, dtype=bool), False)  # code -1 (missing) -> no match
+        mask |= hits[codes]
+    return mask
+
+
+def _sorted_positions(df, positions, column, ascending):
+    values = df[column].iloc[positions].reset_index(drop=True)
+    try:
+        order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index
+    except TypeError:
+        # Mixed types in an object column - compare as text
+        order = values.astype(str).sort_values(ascending=ascending, kind='stable').index
+    return positions[order.to_numpy()]
+
+
+def _row_order(df, sort_column, ascending, query, search_columns):
+    """Row positions after search + sort"""
+    positions = np.arange(len(df))
+    if query:
+        positions = positions[_search_mask(df, search_columns, query)]
+    if sort_column != _SHEET_ORDER:
+        positions = _sorted_positions(df, positions, sort_column, ascending)
+    return positions
+
+
+@st.cache_resource(ttl=300, max_entries=32)
+def _cached_row_order(_df, key, version, filter_key, n_rows, sort_column, ascending, query, search_columns):
+    """_row_order once per table state and snapshot (version = the frame's token)"""
+    return _row_order(_df, sort_column, ascending, query, search_columns)
+
+
+def render_paged_table(df, key, filter_key=(), columns=None, height=None):
+    """
+    Column picker, search, sort and one page of df.
+
+    Args:
+        df: frame to show (a fetched snapshot or a view of one); a frame
+            without a snapshot token is searched / sorted on every rerun
+        key: unique widget key prefix
+        filter_key: hashable description of the filters that produced df
+            (required for views - they carry their source's token)
+        columns: columns shown by default (first DEFAULT_VISIBLE_COLUMNS if None)
+    Returns number of rows matching the search.
+    """
+    all_columns = list(df.columns)
+    default = [c for c in (columns or all_columns[:DEFAULT_VISIBLE_COLUMNS]) if c in all_columns]
+    with st.expander(f"🧩 Columns ({len(all_columns)} available)", expanded=False):
+        visible = st.multiselect("Show columns", all_columns, default=default, key=f"{key}_columns")
+    visible = visible or default
+
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        query = st.text_input(
+            "Search", placeholder="Search shown columns", key=f"{key}_search"
+        ).strip()
+    with col2:
+        sort_column = st.selectbox("Sort by", [_SHEET_ORDER] + visible, key=f"{key}_sort")
+    with col3:
+        descending = st.checkbox("Descending", key=f"{key}_desc")
+    with col4:
+        page_size = st.selectbox("Rows / page", PAGE_SIZES, index=1, key=f"{key}_page_size")
+
+    version = snapshot_version(df)
+    if version:
+        positions = _cached_row_order(
+            df, key, version, filter_key, len(df), sort_column, not descending, query, tuple(visible)
+        )
+    else:
+        positions = _row_order(df, sort_column, not descending, query, tuple(visible))
+    total = len(positions)
+    pages = max(1, math.ceil(total / page_size))
+    # Keep the page in range when a search / filter shrinks the result
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+
+    if total == 0:
+        st.info("No rows match your search")
+        return 0
+
+    page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    start = (page - 1) * page_size
+    page_df = df.iloc[positions[start:start + page_size]][visible]
+    st.dataframe(page_df, use_container_width=True, height=height)
+
+    matched = f" · {total:,} of {len(df):,} match the search" if query else ""
+    st.caption(f"Rows {start + 1:,}–{start + len(page_df):,} of {total:,}{matched}")
+    return total
@@ -0,0 +1,236 @@
+# recruiter_stats.py
+# ====================================================
+# RECRUITER PRODUCTIVITY LEADERBOARD (no Streamlit UI)
+# ====================================================
+# Per-user aggregate maintained incrementally. Each update only consumes
+# rows past the state's watermarks:
+#   - Interview_Events: append-only -> row-count watermark
+#   - Login_Logs:       append-only -> row-count watermark
+#   - Interview_Records: Last Updated watermark, only for records that have
+#     no events (history from before the event log) - attributed to Updated By
+# Time-to-action = hours since the record's previous action (or since the
+# record was created for its first action).
+
+import numpy as np
+import pandas as pd
+
+from interview_events import EVENT_HEADERS
+
+
+STATE_VERSION = 1
+STATE_FILE = "leaderboard.pkl"
+
+LEADERBOARD_COLUMNS = [
+    'Recruiter', 'Scheduled', 'Results Updated', 'Placements', 'Actions',
+    'Median Hours to Action', 'Logins', 'Last Login',
+]
+
+# Actors that are automation, not recruiters
+SYSTEM_ACTORS = {'', 'system', 'nan', 'none'}
+
+SCHEDULED_STATUSES = ['Interview Scheduled', 'Rescheduled']
+
+# Result values that are not a recruiter decision
+NON_RESULTS = ['', 'Pending', 'Cancelled due to Selection']
+
+
+def new_state():
+    return {
+        'version': STATE_VERSION,
+        'events_seen': 0,
+        'logins_seen': 0,
+        'records_watermark': pd.NaT,
+        'event_records': set(),
+        'last_action': {},
+        'users': {},
+    }
+
+
+def _user(state, name):
+    return state['users'].setdefault(name, {
+        'scheduled': 0, 'results': 0, 'placements': 0, 'actions': 0,
+        'latencies': [], 'logins': 0, 'last_login': pd.NaT,
+    })
+
+
+def _is_recruiter(actors):
+    return ~actors.astype(str).str.strip().str.lower().isin(SYSTEM_ACTORS)
+
+
+def _split_status(labels):
+    """'Interview Status / Result Status' -> (interview part, result part)"""
+    parts = labels.astype(str).str.split(' / ', n=1, expand=True).reindex(columns=[0, 1])
+    return parts[0].fillna("").str.strip(), parts[1].fillna("").str.strip()
+
+
+def _add_counts(state, actors, scheduled, results, placements, latencies):
+    """Fold per-row flags into the per-user totals (grouped, not per row)"""
+    frame = pd.DataFrame({
+        'actor': actors.astype(str).str.strip(),
+        'scheduled': scheduled.astype(int),
+        'results': results.astype(int),
+        'placements': placements.astype(int),
+        'latency': latencies,
+    })
+    for actor, group in frame.groupby('actor', sort=False):
+        user = _user(state, actor)
+        user['scheduled'] += int(group['scheduled'].sum())
+        user['results'] += int(group['results'].sum())
+        user['placements'] += int(group['placements'].sum())
+        user['actions'] += len(group)
+        user['latencies'].extend(group['latency'].dropna().round(2).tolist())
+
+
+def consume_events(state, events_df, created):
+    """
+    Consume Interview_Events rows past state['events_seen'].
+
+    Args:
+        created: {record_id: Date Created} for first-action latency
+    Returns number of rows consumed.
+    """
+    new = events_df.iloc[state['events_seen']:]
+    state['events_seen'] = len(events_df)
+    if len(new) == 0:
+        return 0
+
+    new = new.assign(
+        _rid=new['Record ID'].astype(str).str.strip(),
+        _ts=pd.to_datetime(new['Timestamp'], errors='coerce'),
+    ).sort_values('_ts', kind='stable')
+
+    # Previous action on the same record: earlier row in this batch, else state, else creation
+    previous = new.groupby('_rid')['_ts'].shift(1)
+    carried = new['_rid'].map(state['last_action'])
+    carried = pd.to_datetime(carried.fillna(new['_rid'].map(created)), errors='coerce')
+    previous = previous.fillna(carried)
+    hours = (new['_ts'] - previous) / pd.Timedelta(hours=1)
+    hours = hours.where(hours >= 0)
+
+    from_interview, from_result = _split_status(new['From Status'])
+    to_interview, to_result = _split_status(new['To Status'])
+    scheduled = to_interview.isin(SCHEDULED_STATUSES) & (to_interview != from_interview)
+    results = (to_result != from_result) & ~to_result.isin(NON_RESULTS)
+    placements = (to_result == 'Selected') & (from_result != 'Selected')
+
+    recruiter = _is_recruiter(new['Actor'])
+    _add_counts(
+        state, new['Actor'][recruiter], scheduled[recruiter],
+        results[recruiter], placements[recruiter], hours[recruiter],
+    )
+
+    latest = new.dropna(subset=['_ts']).groupby('_rid')['_ts'].max()
+    for rid, ts in latest.items():
+        known = state['last_action'].get(rid)
+        if known is None or ts > known:
+            state['last_action'][rid] = ts
+    state['event_records'].update(new['_rid'])
+    return len(new)
+
+
+def consume_records(state, interviews_df):
+    """
+    Consume Interview_Records rows updated after state['records_watermark']
+    that have no event history. Each counts as one action by Updated By.
+    Returns number of rows consumed.
+    """
+    if len(interviews_df) == 0 or not {'Record ID', 'Last Updated', 'Updated By'} <= set(interviews_df.columns):
+        return 0
+
+    updated = pd.to_datetime(interviews_df['Last Updated'], errors='coerce')
+    watermark = state['records_watermark']
+    fresh = updated.notna() if pd.isna(watermark) else updated > watermark
+    rids = interviews_df['Record ID'].astype(str).str.strip()
+    take = fresh & ~rids.isin(state['event_records']) & _is_recruiter(interviews_df['Updated By'])
+
+    if updated.notna().any():
+        latest = updated.max()
+        state['records_watermark'] = latest if pd.isna(watermark) else max(watermark, latest)
+
+    rows = interviews_df[take]
+    if len(rows) == 0:
+        return 0
+
+    interview_status = rows.get('Interview Status', pd.Series("", index=rows.index)).astype(str).str.strip()
+    result_status = rows.get('Result Status', pd.Series("", index=rows.index)).astype(str).str.strip()
+    created = pd.to_datetime(rows.get('Date Created', pd.Series(pd.NaT, index=rows.index)), errors='coerce')
+    hours = (updated[take] - created) / pd.Timedelta(hours=1)
+
+    _add_counts(
+        state, rows['Updated By'],
+        interview_status.ne('Matched') & interview_status.ne(""),
+        ~result_status.isin(NON_RESULTS),
+        result_status.eq('Selected'),
+        hours.where(hours >= 0),
+    )
+    return len(rows)
+
+
+def consume_logins(state, logins_df):
+    """Consume Login_Logs rows past state['logins_seen'] (successful logins only)"""
+    new = logins_df.iloc[state['logins_seen']:]
+    state['logins_seen'] = len(logins_df)
+    if len(new) == 0:
+        return 0
+
+    user_col = next((c for c in ['Username', 'User', 'username'] if c in new.columns), None)
+    if user_col is None or 'Status' not in new.columns:
+        return len(new)
+
+    success = new[new['Status'].astype(str).str.strip() == 'Success']
+    times = pd.to_datetime(success.get('Timestamp', pd.Series(pd.NaT, index=success.index)), errors='coerce')
+    for name, group_times in times.groupby(success[user_col].astype(str).str.strip()):
+        user = _user(state, name)
+        user['logins'] += len(group_times)
+        last = group_times.max()
+        if pd.notna(last) and (pd.isna(user['last_login']) or last > user['last_login']):
+            user['last_login'] = last
+    return len(new)
+
+
+def update_state(state, events_df, interviews_df, logins_df):
+    """
+    Bring the state up to date with the latest snapshots.
+    A sheet shorter than its watermark (rows deleted / sheet recreated)
+    triggers a full rebuild. Returns (state, rows consumed).
+    """
+    if (state is None or state.get('version') != STATE_VERSION
+            or len(events_df) < state['events_seen'] or len(logins_df) < state['logins_seen']):
+        state = new_state()
+
+    created = {}
+    if len(interviews_df) > 0 and {'Record ID', 'Date Created'} <= set(interviews_df.columns):
+        created = dict(zip(
+            interviews_df['Record ID'].astype(str).str.strip(),
+            pd.to_datetime(interviews_df['Date Created'], errors='coerce'),
+        ))
+
+    consumed = 0
+    if len(events_df) > 0 and set(EVENT_HEADERS[:5]) <= set(events_df.columns):
+        consumed += consume_events(state, events_df, created)
+    consumed += consume_records(state, interviews_df)
+    consumed += consume_logins(state, logins_df)
+    return state, consumed
+
+
+def leaderboard_frame(state):
+    """Leaderboard table, best first (placements, then actions)"""
+    rows = []
+    for name, user in state['users'].items():
+        rows.append({
+            'Recruiter': name,
+            'Scheduled': user['scheduled'],
+            'Results Updated': user['results'],
+            'Placements': user['placements'],
+            'Actions': user['actions'],
+            'Median Hours to Action': round(float(np.median(user['latencies'])), 1) if user['latencies'] else None,
+            'Logins': user['logins'],
+            'Last Login': user['last_login'],
+        })
+    if not rows:
+        return pd.DataFrame(columns=LEADERBOARD_COLUMNS)
+    return (
+        pd.DataFrame(rows, columns=LEADERBOARD_COLUMNS)
+        .sort_values(['Placements', 'Actions'], ascending=False, kind='stable')
+        .reset_index(drop=True)
+    )
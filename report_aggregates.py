@@ -0,0 +1,133 @@
+# report_aggregates.py
+# ====================================================
+# DAILY REPORT AGGREGATES (no Streamlit UI)
+# ====================================================
+# One row per date with registrations, interviews, selections and vacancies,
+# built with one grouped pass per source per snapshot. Period metrics and
+# trend charts in Reports & Analytics are slices/sums of this table instead
+# of per-day full-frame masks.
+
+import pandas as pd
+
+
+DAILY_COLUMNS = ['Registrations', 'Interviews', 'Interviews Held', 'Selections', 'Vacancies']
+
+# Interview statuses counted as "conducted" in the period metrics
+HELD_STATUSES = ['Interview Completed', 'Interview Scheduled']
+
+
+def _day_counts(dates, mask=None):
+    """Count rows per calendar day (unparseable dates dropped)"""
+    dates = pd.to_datetime(dates, errors='coerce')
+    if mask is not None:
+        dates = dates[mask]
+    return dates.dropna().dt.normalize().value_counts()
+
+
+def interview_contributions(interviews_df):
+    """
+    What each Interview_Records row contributes to the daily table.
+
+    Returns DataFrame (one row per record) with:
+        Record ID, Last Updated, Interview Status, Result Status,
+        Interview Day  - normalized Interview Date (NaT if none)
+        Held           - status is Completed/Scheduled
+        Selection Day  - normalized Last Updated for 'Selected' rows, else NaT
+    """
+    columns = ['Record ID', 'Last Updated', 'Interview Status', 'Result Status',
+               'Interview Day', 'Held', 'Selection Day']
+    if len(interviews_df) == 0:
+        return pd.DataFrame(columns=columns)
+
+    def _column(name):
+        if name in interviews_df.columns:
+            return interviews_df[name]
+        return pd.Series("", index=interviews_df.index)
+
+    last_updated = pd.to_datetime(_column('Last Updated'), errors='coerce')
+    selected = _column('Result Status') == 'Selected'
+    return pd.DataFrame({
+        'Record ID': _column('Record ID').astype(str).str.strip(),
+        'Last Updated': last_updated,
+        'Interview Status': _column('Interview Status').astype(str),
+        'Result Status': _column('Result Status').astype(str),
+        'Interview Day': pd.to_datetime(_column('Interview Date'), errors='coerce').dt.normalize(),
+        'Held': _column('Interview Status').isin(HELD_STATUSES),
+        'Selection Day': last_updated.dt.normalize().where(selected),
+    }).reset_index(drop=True)
+
+
+def contribution_counts(contributions):
+    """Interviews / Interviews Held / Selections per day from interview_contributions rows"""
+    series = {
+        'Interviews': contributions['Interview Day'].dropna().value_counts(),
+        'Interviews Held': contributions.loc[contributions['Held'].astype(bool), 'Interview Day'].dropna().value_counts(),
+        'Selections': contributions['Selection Day'].dropna().value_counts(),
+    }
+    return pd.DataFrame(series).reindex(columns=DAILY_COLUMNS).fillna(0).astype('int64')
+
+
+def _finish(daily):
+    daily = daily.reindex(columns=DAILY_COLUMNS).fillna(0).astype('int64')
+    daily.index = pd.DatetimeIndex(daily.index, name='Date')
+    return daily.sort_index()
+
+
+def build_daily_aggregates(candidates_df, interviews_df, vacancies_df):
+    """
+    Build the daily aggregates table from one snapshot.
+
+    Returns DataFrame indexed by date (DatetimeIndex, sorted) with DAILY_COLUMNS:
+        Registrations   - candidates by Date Applied
+        Interviews      - interview records by Interview Date
+        Interviews Held - same, only Completed/Scheduled
+        Selections      - Result Status 'Selected' by Last Updated
+        Vacancies       - vacancies by Date Added
+    """
+    series = {}
+
+    if len(candidates_df) > 0 and 'Date Applied' in candidates_df.columns:
+        series['Registrations'] = _day_counts(candidates_df['Date Applied'])
+
+    if len(vacancies_df) > 0 and 'Date Added' in vacancies_df.columns:
+        series['Vacancies'] = _day_counts(vacancies_df['Date Added'])
+
+    daily = pd.DataFrame(series)
+    if len(interviews_df) > 0:
+        daily = daily.add(contribution_counts(interview_contributions(interviews_df)), fill_value=0)
+    return _finish(daily)
+
+
+def apply_daily_delta(daily, additions=None, removals=None):
+    """daily + additions - removals (all DAILY_COLUMNS frames indexed by date)"""
+    result = daily
+    if additions is not None and len(additions) > 0:
+        result = result.add(additions, fill_value=0)
+    if removals is not None and len(removals) > 0:
+        result = result.sub(removals, fill_value=0)
+    result = _finish(result)
+    # days whose only rows moved away are dropped, same as a fresh build
+    return result[result.ne(0).any(axis=1)]
+
+
+def slice_days(daily, start_date, end_date):
+    """Rows of the daily table for every date in [start_date, end_date] (missing days = 0)"""
+    days = pd.date_range(
+        pd.Timestamp(start_date).normalize(), pd.Timestamp(end_date).normalize(), freq='D', name='Date'
+    )
+    return daily.reindex(days, fill_value=0)
+
+
+def period_totals(daily, start_date, end_date):
+    """Sum of each DAILY_COLUMNS metric over [start_date, end_date] as a dict of ints"""
+    totals = slice_days(daily, start_date, end_date).sum()
+    return {column: int(totals.get(column, 0)) for column in DAILY_COLUMNS}
+
+
+def daily_trend(daily, start_date, end_date):
+    """Trend chart frame for the period: Candidates / Interviews / Selections per day"""
+    trend = slice_days(daily, start_date, end_date)[['Registrations', 'Interviews', 'Selections']]
+    trend = trend.rename(columns={'Registrations': 'Candidates'})
+    trend.index = trend.index.date
+    trend.index.name = 'Date'
+    return trend
@@ -0,0 +1,76 @@
+"""
+Report Job
+Builds the precomputed Reports & Analytics artifact outside Streamlit
+Run from cron, e.g. nightly:  python report_job.py --credentials credentials.json
+"""
+
+import argparse
+import logging
+import sys
+
+import gspread
+from oauth2client.service_account import ServiceAccountCredentials
+
+from sheet_ingest import to_typed_df
+from sheet_mirror import values_frame
+from report_store import STORE_DIR, build_report_artifact, save_artifact
+
+logger = logging.getLogger(__name__)
+
+SHEET_ID = "1rpuXdpfwjy0BQcaZcn0Acbh-Se6L3PvyNGiNu4NLcPA"
+
+SCOPE = [
+    "https://spreadsheets.google.com/feeds",
+    "https://www.googleapis.com/auth/drive",
+]
+
+REPORT_SHEETS = ["Candidates", "Interview_Records", "Sheet4", "CID"]
+
+
+def fetch_report_sheets(credentials_file, sheet_id=SHEET_ID):
+    """
+    Read the four report worksheets as typed DataFrames {sheet_name: df}.
+    Cells are read as text (get_all_values, like the app's mirror) so IDs
+    and amounts in the artifact compare equal to the app's live rows.
+    """
+    credentials = ServiceAccountCredentials.from_json_keyfile_name(credentials_file, SCOPE)
+    spreadsheet = gspread.authorize(credentials).open_by_key(sheet_id)
+
+    frames = {}
+    for name in REPORT_SHEETS:
+        data = spreadsheet.worksheet(name).get_all_values()
+        frames[name] = to_typed_df(values_frame(data), name)
+        logger.info(f"Fetched {name}: {len(frames[name])} rows")
+    return frames
+
+
+def run_report_job(credentials_file, store_dir=STORE_DIR, sheet_id=SHEET_ID):
+    """Fetch, materialize and save. Returns the artifact path."""
+    frames = fetch_report_sheets(credentials_file, sheet_id)
+    artifact = build_report_artifact(
+        frames["Candidates"], frames["Interview_Records"], frames["Sheet4"], frames["CID"]
+    )
+    return save_artifact(artifact, store_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Materialize the Reports & Analytics artifact")
+    parser.add_argument("--credentials", default="credentials.json",
+                        help="service account JSON key (default: credentials.json)")
+    parser.add_argument("--store", default=STORE_DIR,
+                        help=f"directory for the artifact (default: {STORE_DIR}, env REPORT_STORE_DIR)")
+    parser.add_argument("--sheet-id", default=SHEET_ID, help="spreadsheet key")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    try:
+        path = run_report_job(args.credentials, args.store, args.sheet_id)
+    except Exception as e:
+        logger.error(f"Report job failed: {e}")
+        return 1
+    print(f"✅ Report artifact written: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+# report_store.py
+# ====================================================
+# PRECOMPUTED REPORT ARTIFACT (no Streamlit UI)
+# ====================================================
+# report_job.py materializes the Reports & Analytics views (daily table for
+# Today / Week / Month, overall totals and status distributions) into a small
+# pickle in a local store. The Reports tab loads that artifact and only
+# applies the live deltas since it was built:
+#   - candidates / vacancies added after the build
+#   - interview records past the artifact's high-water mark (row count +
+#     last Record ID) or whose Last Updated is after the build - only those
+#     rows are re-counted (their old contribution is subtracted, the current
+#     one added)
+# report_job.py and the app both read sheets as text (get_all_values /
+# the mirror), so unchanged rows compare equal.
+
+import logging
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from report_aggregates import (
+    build_daily_aggregates, interview_contributions, contribution_counts,
+    apply_daily_delta, _day_counts, DAILY_COLUMNS,
+)
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = 2
+
+STORE_DIR = os.environ.get("REPORT_STORE_DIR", "report_store")
+ARTIFACT_FILE = "reports.pkl"
+
+# overall distribution key -> Interview_Records column
+STATUS_COLUMNS = {
+    'interview_status_counts': 'Interview Status',
+    'result_status_counts': 'Result Status',
+}
+
+
+def store_path(filename, store_dir=None):
+    return os.path.join(store_dir or STORE_DIR, filename)
+
+
+def artifact_path(store_dir=None):
+    return store_path(ARTIFACT_FILE, store_dir)
+
+
+def save_pickle(obj, filename, store_dir=None):
+    """Atomically write obj to the store (temp file + rename) so readers never see a partial file"""
+    path = store_path(filename, store_dir)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_pickle(filename, store_dir=None):
+    """Read an object from the store; None if missing or unreadable"""
+    path = store_path(filename, store_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.error(f"Could not read {path}: {e}")
+        return None
+
+
+def _status_counts(df, column):
+    if len(df) == 0 or column not in df.columns:
+        return pd.Series(dtype='int64')
+    return df[column].value_counts()
+
+
+def _overall(candidates_df, interviews_df, vacancies_df, companies_df, status_counts):
+    overall = {
+        'companies': len(companies_df),
+        'vacancies': len(vacancies_df),
+        'candidates': len(candidates_df),
+        'interviews': len(interviews_df),
+    }
+    overall.update(status_counts)
+    return overall
+
+
+def build_report_artifact(candidates_df, interviews_df, vacancies_df, companies_df, built_at=None):
+    """
+    Materialize every Reports view from one snapshot.
+
+    Returns dict:
+        version, built_at
+        daily          - report_aggregates daily table
+        interviews     - interview_contributions() per record (used for deltas)
+        interview_rows - Interview_Records row count  } high-water mark of
+        last_record    - Record ID of the last row    } the live delta pass
+        overall        - totals + Interview/Result Status distributions
+    """
+    built_at = pd.Timestamp(built_at or pd.Timestamp.now())
+    status_counts = {
+        key: _status_counts(interviews_df, column) for key, column in STATUS_COLUMNS.items()
+    }
+    return {
+        'version': ARTIFACT_VERSION,
+        'built_at': built_at,
+        'daily': build_daily_aggregates(candidates_df, interviews_df, vacancies_df),
+        'interviews': interview_contributions(interviews_df),
+        'interview_rows': len(interviews_df),
+        'last_record': _last_record(interviews_df),
+        'overall': _overall(candidates_df, interviews_df, vacancies_df, companies_df, status_counts),
+    }
+
+
+def save_artifact(artifact, store_dir=None):
+    """Write the artifact to the store"""
+    path = save_pickle(artifact, ARTIFACT_FILE, store_dir)
+    logger.info(f"Report artifact written to {path} (built {artifact['built_at']})")
+    return path
+
+
+def artifact_mtime(store_dir=None):
+    """Modification time of the artifact (None if missing) - used as a cache key"""
+    try:
+        return os.path.getmtime(artifact_path(store_dir))
+    except OSError:
+        return None
+
+
+def load_artifact(store_dir=None):
+    """Read the artifact; None if missing, unreadable or from another version"""
+    artifact = load_pickle(ARTIFACT_FILE, store_dir)
+    if artifact is None:
+        return None
+    if not isinstance(artifact, dict) or artifact.get('version') != ARTIFACT_VERSION:
+        logger.warning(f"Ignoring report artifact {artifact_path(store_dir)}: unknown version")
+        return None
+    return artifact
+
+
+def _last_record(interviews_df):
+    if len(interviews_df) == 0 or 'Record ID' not in interviews_df.columns:
+        return None
+    return str(interviews_df['Record ID'].iloc[-1]).strip()
+
+
+def changed_interviews(artifact, interviews_df):
+    """
+    Interview_Records rows to re-count since the artifact was built, without
+    touching unchanged rows: rows past the high-water mark (appended since)
+    plus earlier rows whose Last Updated is after the build. If rows were
+    deleted or reordered (the high-water row moved) this falls back to
+    comparing Record IDs.
+
+    Returns (rows, deleted) - rows: slice of interviews_df, deleted: set of
+    Record IDs in the artifact that are no longer in the sheet.
+    """
+    n = artifact['interview_rows']
+    if 'Last Updated' in interviews_df.columns:
+        updated = np.array(pd.to_datetime(interviews_df['Last Updated'], errors='coerce') > artifact['built_at'])
+    else:
+        updated = np.zeros(len(interviews_df), dtype=bool)
+
+    if len(interviews_df) >= n and (n == 0 or _last_record(interviews_df.iloc[:n]) == artifact['last_record']):
+        updated[n:] = True
+        return interviews_df[updated], set()
+
+    old_ids = set(artifact['interviews']['Record ID'])
+    if 'Record ID' in interviews_df.columns:
+        live_ids = interviews_df['Record ID'].astype(str).str.strip()
+    else:
+        live_ids = pd.Series("", index=interviews_df.index)
+    mask = updated | ~live_ids.isin(old_ids).to_numpy()
+    return interviews_df[mask], old_ids - set(live_ids)
+
+
+def apply_live_deltas(artifact, candidates_df, interviews_df, vacancies_df, companies_df):
+    """
+    Current report views = artifact + changes since artifact['built_at'].
+
+    Returns dict:
+        daily     - current daily table
+        overall   - current totals + status distributions
+        built_at  - when the artifact was built
+        changed   - number of live rows that had to be (re)counted
+    """
+    built_at = artifact['built_at']
+    additions = []
+    changed = 0
+
+    if len(candidates_df) > 0 and 'Date Applied' in candidates_df.columns:
+        applied = pd.to_datetime(candidates_df['Date Applied'], errors='coerce')
+        new_candidates = _day_counts(applied, applied > built_at)
+        additions.append(pd.DataFrame({'Registrations': new_candidates}))
+        changed += int(new_candidates.sum())
+
+    if len(vacancies_df) > 0 and 'Date Added' in vacancies_df.columns:
+        added = pd.to_datetime(vacancies_df['Date Added'], errors='coerce')
+        new_vacancies = _day_counts(added, added > built_at)
+        additions.append(pd.DataFrame({'Vacancies': new_vacancies}))
+        changed += int(new_vacancies.sum())
+
+    # New or touched since the build -> recount; deleted since the build -> drop
+    old = artifact['interviews']
+    rows, deleted = changed_interviews(artifact, interviews_df)
+    touched = interview_contributions(rows)
+    stale = old[old['Record ID'].isin(set(touched['Record ID']) | deleted)]
+    changed += len(touched) + len(deleted)
+
+    if len(touched) > 0:
+        additions.append(contribution_counts(touched))
+
+    addition = pd.concat(additions).groupby(level=0).sum() if additions else None
+    removal = contribution_counts(stale) if len(stale) > 0 else None
+    daily = apply_daily_delta(artifact['daily'], addition, removal)
+
+    status_counts = {}
+    for key, column in STATUS_COLUMNS.items():
+        counts = (
+            artifact['overall'][key]
+            .add(touched[column].value_counts(), fill_value=0)
+            .sub(stale[column].value_counts(), fill_value=0)
+            .astype('int64')
+        )
+        status_counts[key] = counts[counts > 0].sort_values(ascending=False)
+
+    return {
+        'daily': daily.reindex(columns=DAILY_COLUMNS),
+        'overall': _overall(candidates_df, interviews_df, vacancies_df, companies_df, status_counts),
+        'built_at': built_at,
+        'changed': changed,
+    }
@@ -0,0 +1,170 @@
+"""
+Session Store Module
+Heavy per-session state (job matching results) kept outside st.session_state
+in one process-wide store with memory accounting:
+  - a byte budget per session (that session's oldest items go first)
+  - a byte budget for the whole process (least recently active sessions go first)
+  - everything of a session idle for SESSION_IDLE_MINUTES is dropped
+Light state (filter chains, widget values) stays in st.session_state
+"""
+
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+SESSION_BUDGET_MB = float(os.environ.get("SESSION_BUDGET_MB", "50"))
+PROCESS_BUDGET_MB = float(os.environ.get("SESSION_STORE_MB", "300"))
+SESSION_IDLE_MINUTES = float(os.environ.get("SESSION_IDLE_MINUTES", "30"))
+
+_MB = 1024 * 1024
+
+STATS_COLUMNS = ['Session', 'User', 'Items', 'MB', 'Idle (min)']
+
+
+def new_store(session_budget_mb=SESSION_BUDGET_MB, process_budget_mb=PROCESS_BUDGET_MB,
+              idle_minutes=SESSION_IDLE_MINUTES):
+    return {
+        'sessions': {},  # session id -> {'items': OrderedDict(key -> (obj, bytes)), 'bytes', 'last_seen', 'user'}
+        'bytes': 0,
+        'session_budget': int(session_budget_mb * _MB),
+        'process_budget': int(process_budget_mb * _MB),
+        'idle_seconds': idle_minutes * 60,
+        'lock': threading.Lock(),
+    }
+
+
+def size_of(obj):
+    """Approximate bytes held by obj"""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    return sys.getsizeof(obj)
+
+
+def _session(store, session_id, now, user=None):
+    session = store['sessions'].setdefault(
+        session_id, {'items': OrderedDict(), 'bytes': 0, 'last_seen': now, 'user': ""}
+    )
+    session['last_seen'] = now
+    if user:
+        session['user'] = user
+    return session
+
+
+def _drop_item(store, session, key):
+    _, nbytes = session['items'].pop(key)
+    session['bytes'] -= nbytes
+    store['bytes'] -= nbytes
+
+
+def _drop_session(store, session_id):
+    store['bytes'] -= store['sessions'].pop(session_id)['bytes']
+
+
+def _evict(store, current, now):
+    """Drop idle sessions, then least recently active ones while over the process budget"""
+    for session_id, session in list(store['sessions'].items()):
+        if session_id != current and now - session['last_seen'] > store['idle_seconds']:
+            _drop_session(store, session_id)
+    by_activity = sorted(store['sessions'], key=lambda s: store['sessions'][s]['last_seen'])
+    for session_id in by_activity:
+        if store['bytes'] <= store['process_budget']:
+            break
+        if session_id != current:
+            _drop_session(store, session_id)
+
+
+def put(store, session_id, key, obj, user=None, now=None):
+    """
+    Keep obj for the session under key. Returns False if obj alone is over
+    the session budget (then it is not kept).
+    """
+    now = time.time() if now is None else now
+    nbytes = size_of(obj)
+    with store['lock']:
+        session = _session(store, session_id, now, user)
+        if key in session['items']:
+            _drop_item(store, session, key)
+        if nbytes > store['session_budget']:
+            return False
+        session['items'][key] = (obj, nbytes)
+        session['bytes'] += nbytes
+        store['bytes'] += nbytes
+        while session['bytes'] > store['session_budget']:
+            _drop_item(store, session, next(iter(session['items'])))
+        _evict(store, session_id, now)
+    return True
+
+
+def get(store, session_id, key, now=None):
+    """The session's obj under key, or None if never kept or evicted"""
+    now = time.time() if now is None else now
+    with store['lock']:
+        session = store['sessions'].get(session_id)
+        if session is None:
+            return None
+        session['last_seen'] = now
+        item = session['items'].get(key)
+        if item is None:
+            return None
+        session['items'].move_to_end(key)
+        return item[0]
+
+
+def drop(store, session_id, key=None):
+    """Forget one item of the session (or all of it when key is None)"""
+    with store['lock']:
+        if session_id not in store['sessions']:
+            return
+        if key is None:
+            _drop_session(store, session_id)
+        elif key in store['sessions'][session_id]['items']:
+            _drop_item(store, store['sessions'][session_id], key)
+
+
+def store_stats(store, now=None):
+    """One row per session (STATS_COLUMNS), heaviest first"""
+    now = time.time() if now is None else now
+    with store['lock']:
+        rows = [
+            [session_id[:8], session['user'], len(session['items']),
+             round(session['bytes'] / _MB, 2), round((now - session['last_seen']) / 60, 1)]
+            for session_id, session in store['sessions'].items()
+        ]
+    return pd.DataFrame(rows, columns=STATS_COLUMNS).sort_values('MB', ascending=False, kind='stable')
+
+
+@st.cache_resource
+def get_session_store():
+    """The process-wide store shared by every session"""
+    return new_store()
+
+
+def session_id():
+    """Id of the current browser session in the store"""
+    if "_session_store_id" not in st.session_state:
+        st.session_state["_session_store_id"] = uuid.uuid4().hex
+    return st.session_state["_session_store_id"]
+
+
+def stash(key, obj):
+    """Keep obj for this session (budgeted); False if it is too large to keep"""
+    return put(get_session_store(), session_id(), key, obj, user=st.session_state.get("username"))
+
+
+def unstash(key):
+    """This session's obj under key, or None"""
+    return get(get_session_store(), session_id(), key)
+
+
+def discard(key=None):
+    """Forget this session's obj under key (everything when key is None)"""
+    drop(get_session_store(), session_id(), key)
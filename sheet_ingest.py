@@ -0,0 +1,271 @@
+# sheet_ingest.py
+# ====================================================
+# TYPED SHEET INGEST (no Streamlit UI)
+# ====================================================
+# Every date / timestamp column is parsed ONCE when a sheet is fetched, into
+# datetime64 columns, using the formats this app writes plus the ones people
+# type into the sheet by hand. Cells that still do not parse are NaT in the
+# frame; they are counted per column in df.attrs['unparsed_dates'] (shown on
+# the admin data page via unparsed_date_report) - the sheet keeps the text. The frames
+# returned by app.py's fetchers are shared between reruns and sessions, so
+# consumers must treat them as read-only (use .copy() before modifying).
+#
+# Per-worksheet schema for the rest:
+#   - CATEGORY_COLUMNS: repeated labels (status, city, gender, job title ...)
+#     stored as pandas categoricals - one code per row instead of one str
+#     object per cell; a column with too many distinct values stays text
+#   - NUMERIC_COLUMNS: nullable Int64 / Float64, only if every non-empty cell
+#     is a number (otherwise the column stays text)
+#   - everything else: str
+# Interview/Result Status are deliberately left as text: the edit grids and
+# bulk updates assign new statuses into copies of that frame.
+#
+# Each fetched frame carries its own snapshot token in df.attrs['snapshot']
+# (stamp_snapshot). Caches derived from a frame (indexes, row orders,
+# exports) are keyed on snapshot_version(frame), so they can never pair a
+# frame with something built from an earlier fetch.
+
+import itertools
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# Formats written by app.py, export_utils, candidate_wizard_module and
+# job_matcher_module, then hand-entered ones (day-first, as typed in India;
+# month-first only catches what day-first cannot, e.g. 8/15/1995) - tried
+# in this order, first match wins per cell
+DATE_FORMATS = [
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%d-%b-%Y %H:%M:%S',
+    '%d-%b-%Y',
+    '%Y-%m-%d %H:%M',
+    '%d/%m/%Y',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M',
+    '%d-%m-%Y',
+    '%d.%m.%Y',
+    '%d %b %Y',
+    '%d %B %Y',
+    '%d-%B-%Y',
+    '%m/%d/%Y',
+    '%m/%d/%Y %H:%M:%S',
+]
+
+# Date/timestamp columns per worksheet
+DATE_COLUMNS = {
+    'Candidates': ['Date Applied', 'DOB'],
+    'Interview_Records': ['Date Created', 'Interview Date', 'Joining Date', 'Last Updated'],
+    'Sheet4': ['Date Added'],
+    'Interview_Events': ['Timestamp'],
+    'Login_Logs': ['Timestamp'],
+}
+
+# Low-cardinality label columns per worksheet
+CATEGORY_COLUMNS = {
+    'Candidates': [
+        'Gender', 'Marital Status', 'Category', 'Status',
+        'Current City', 'Current District', 'Current State',
+        'Permanent City', 'Permanent District', 'Permanent State',
+        'Job Pref 1', 'Job Pref 2', 'Job Pref 3', 'Preferred Location',
+        'Notice Period', 'Willing to Relocate',
+        '10th Board', '12th Board', '12th Stream',
+        'Graduation Degree', 'Graduation University', 'Graduation Specialization',
+        'Hindi Level', 'English Level', 'Is Fresher',
+        'Disability', 'Own Vehicle', 'Driving License',
+    ],
+    'Sheet4': [
+        'Company Name', 'CID', 'Job Title', 'Job Location/City', 'Education Required',
+        'Gender Preference', 'Job Type', 'Job Timing', 'Work Mode', 'Urgency Level',
+        'Notice Period Acceptable', 'status', 'Status',
+    ],
+    'CID': ['Industry', 'City', 'Location', 'Status'],
+    'Interview_Records': ['Company Name', 'Job Title', 'Interview Round', 'Updated By'],
+    'Interview_Events': ['Actor', 'From Status', 'To Status'],
+    'Login_Logs': ['Username', 'Status'],
+}
+
+# Count columns per worksheet
+NUMERIC_COLUMNS = {
+    'Candidates': ['Experience Years', 'Experience Months'],
+    'Sheet4': ['Vacancy Count', 'Vacancy Filled', 'Age Range Min', 'Age Range Max'],
+}
+
+# A label column becomes categorical only if distinct values <= this share of rows
+CATEGORY_MAX_RATIO = 0.5
+
+_NULL_TEXT = ['nan', 'nat', 'none', '<na>']
+
+
+def _present(text):
+    """Non-empty cells of a stripped text column"""
+    return (text != "") & ~text.str.lower().isin(_NULL_TEXT)
+
+
+def parse_dates(values):
+    """
+    Parse a column of sheet text into datetime64 (NaT for empty/unparseable).
+    Each format is applied vectorized to the cells still unparsed.
+    """
+    text = pd.Series(values).astype(str).str.strip()
+    parsed = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+    pending = _present(text)
+
+    for fmt in DATE_FORMATS:
+        if not pending.any():
+            break
+        attempt = pd.to_datetime(text[pending], format=fmt, errors='coerce')
+        hit = attempt.notna()
+        parsed.loc[attempt.index[hit]] = attempt[hit]
+        pending.loc[attempt.index[hit]] = False
+
+    return parsed
+
+
+def parse_numbers(values):
+    """
+    Column of sheet text -> nullable Int64 (whole numbers) or Float64.
+    None if any non-empty cell is not a number.
+    """
+    text = pd.Series(values).astype(str).str.strip()
+    blank = (text == "") | text.str.lower().isin(_NULL_TEXT)
+    numbers = pd.to_numeric(text.mask(blank), errors='coerce')
+    if numbers[~blank].isna().any():
+        return None
+    present = numbers.dropna()
+    if (present % 1 == 0).all():
+        return numbers.astype('Int64')
+    return numbers.astype('Float64')
+
+
+def to_category(values):
+    """Column of sheet text -> categorical, or str if it has too many distinct values"""
+    text = pd.Series(values).astype(str)
+    if text.nunique() > max(CATEGORY_MAX_RATIO * len(text), 1):
+        return text
+    return text.astype('category')
+
+
+def to_typed_df(data, sheet_name):
+    """
+    Records from get_all_records() (or a text DataFrame) -> DataFrame typed
+    per the worksheet schema: DATE_COLUMNS as datetime64, NUMERIC_COLUMNS as
+    nullable numbers, CATEGORY_COLUMNS as categoricals, the rest as str.
+    """
+    df = pd.DataFrame(data)
+    if df.empty:
+        return df
+
+    dates = DATE_COLUMNS.get(sheet_name, [])
+    numeric = NUMERIC_COLUMNS.get(sheet_name, [])
+    labels = CATEGORY_COLUMNS.get(sheet_name, [])
+    unparsed = {}
+    # Positional, so sheets with duplicate / blank headers still work
+    for pos, col in enumerate(df.columns):
+        values = df.iloc[:, pos]
+        if col in dates:
+            parsed = parse_dates(values)
+            text = values.astype(str).str.strip()
+            missed = text[_present(text) & parsed.isna()]
+            if len(missed) > 0:
+                unparsed[col] = {'cells': len(missed), 'examples': missed.unique()[:3].tolist()}
+                logger.warning(
+                    f"{sheet_name}.{col}: {len(missed)} date cell(s) in an unknown format, "
+                    f"e.g. {unparsed[col]['examples']}"
+                )
+            df.isetitem(pos, parsed)
+            continue
+        if col in numeric:
+            numbers = parse_numbers(values)
+            if numbers is not None:
+                df.isetitem(pos, numbers)
+                continue
+        if col in labels:
+            df.isetitem(pos, to_category(values))
+        else:
+            df.isetitem(pos, values.astype(str))
+    if unparsed:
+        df.attrs['unparsed_dates'] = unparsed
+    return df
+
+
+def unparsed_date_report(frames):
+    """
+    Date cells that did not match any DATE_FORMATS (empty in the frames,
+    still text in the sheet). frames: {sheet_name: typed DataFrame}.
+    Returns DataFrame: Worksheet, Column, Cells, Examples
+    """
+    rows = [
+        {
+            'Worksheet': sheet_name,
+            'Column': col,
+            'Cells': info['cells'],
+            'Examples': ", ".join(info['examples']),
+        }
+        for sheet_name, df in frames.items() if df is not None
+        for col, info in df.attrs.get('unparsed_dates', {}).items()
+    ]
+    return pd.DataFrame(rows, columns=['Worksheet', 'Column', 'Cells', 'Examples'])
+
+
+_fetch_counter = itertools.count()
+
+
+def stamp_snapshot(df):
+    """Tag a freshly fetched frame with a token unique to this fetch; returns df"""
+    df.attrs['snapshot'] = f"{pd.Timestamp.now().strftime('%Y%m%d%H%M%S%f')}-{next(_fetch_counter)}"
+    return df
+
+
+def snapshot_version(*frames):
+    """
+    Version token of one or more fetched frames - changes whenever any of
+    them is refetched. pandas carries attrs over to slices of a frame, so a
+    filtered view has its source's token: key view caches on the filter too.
+    """
+    return "|".join(str(df.attrs.get('snapshot', "")) if df is not None else "" for df in frames)
+
+
+def memory_report(frames):
+    """
+    Memory per worksheet. frames: {sheet_name: typed DataFrame}.
+    'As Text' is what the same frame takes with every column as str.
+    Returns DataFrame: Worksheet, Rows, Columns, Categorical, Numeric,
+    Dates, Memory (KB), As Text (KB), Saved %
+    """
+    rows = []
+    for sheet_name, df in frames.items():
+        if df is None:
+            continue
+        typed = int(df.memory_usage(deep=True, index=False).sum())
+        as_text = sum(
+            int(df[col].astype(str).memory_usage(deep=True, index=False)) for col in df.columns
+        )
+        dtypes = df.dtypes
+        rows.append({
+            'Worksheet': sheet_name,
+            'Rows': len(df),
+            'Columns': len(df.columns),
+            'Categorical': int(sum(isinstance(t, pd.CategoricalDtype) for t in dtypes)),
+            'Numeric': int(sum(pd.api.types.is_numeric_dtype(t) for t in dtypes)),
+            'Dates': int(sum(pd.api.types.is_datetime64_any_dtype(t) for t in dtypes)),
+            'Memory (KB)': round(typed / 1024, 1),
+            'As Text (KB)': round(as_text / 1024, 1),
+            'Saved %': round((1 - typed / as_text) * 100, 1) if as_text else 0.0,
+        })
+    return pd.DataFrame(rows, columns=[
+        'Worksheet', 'Rows', 'Columns', 'Categorical', 'Numeric', 'Dates',
+        'Memory (KB)', 'As Text (KB)', 'Saved %',
+    ])
+
+
+def format_date(value, with_time=False):
+    """Display text for a parsed date cell ('' for NaT/missing)"""
+    if value is None or pd.isna(value):
+        return ""
+    if not hasattr(value, 'strftime'):
+        return str(value)
+    return value.strftime('%Y-%m-%d %H:%M:%S' if with_time else '%Y-%m-%d')
@@ -0,0 +1,466 @@
+# sheet_mirror.py
+# ====================================================
+# LOCAL SQLITE MIRROR OF THE WORKSHEETS (no Streamlit UI)
+# ====================================================
+# Each mirrored worksheet is one table (all TEXT, sheet headers as columns)
+# plus _sheet_row (row number in the sheet, NULL for local rows not pushed
+# yet) and _hash (hash of the row as last pulled). Indexes on the id,
+# status and date columns. Reads never touch the Sheets API. SQLite column
+# names ignore case, so headers differing only in case (Sheet4: status /
+# Status) get a numbered suffix in the table; read_frame restores the sheet
+# headers.
+#
+# Sync protocol:
+#   - pull:  get_all_values() per sheet -> table replaced in one transaction,
+#            pending local appends re-applied on top. The sync worker only
+#            pulls sheets that are due (due_sheets): marked stale, or older
+#            than max_age and read since their last pull - an idle app makes
+#            no Sheets reads
+#   - push:  local appends queued in _outbox are written with ONE
+#            append_rows per sheet; an append whose key (Candidate ID / CID /
+#            Record ID) already exists in the sheet - someone added it
+#            directly in Google Sheets - is not written and lands in
+#            _conflicts instead
+#   - stale: writes that go straight to Sheets mark the mirror stale so the
+#            next read pulls first
+#
+# Use one connection per thread (open_mirror); SQLite serializes writers
+# and WAL lets readers run during a sync.
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+
+import gspread
+import pandas as pd
+
+from report_store import STORE_DIR
+from sheet_ingest import DATE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+MIRROR_FILE = "sheet_mirror.db"
+
+# SHEET_MIRROR=0 turns the mirror off (reads/writes hit Sheets directly)
+MIRROR_ENABLED = os.environ.get("SHEET_MIRROR", "1") != "0"
+
+# Seconds after which a pulled sheet that is in use is pulled again
+MAX_AGE_SECONDS = 300
+
+MIRROR_SHEETS = ["CID", "Sheet2", "Sheet4", "Candidates", "Interview_Records", "Login_Logs", "Interview_Events"]
+
+# Sheet -> column that identifies a row (appends colliding on it are conflicts)
+KEY_COLUMNS = {
+    "CID": "CID",
+    "Candidates": "Candidate ID",
+    "Interview_Records": "Record ID",
+}
+
+# Columns indexed wherever a mirrored sheet has them (+ every DATE_COLUMNS entry)
+INDEX_COLUMNS = ["Candidate ID", "CID", "Record ID", "Status", "status", "Interview Status", "Result Status"]
+
+_META_SCHEMA = """
+CREATE TABLE IF NOT EXISTS _sheets (
+    sheet TEXT PRIMARY KEY,
+    headers TEXT NOT NULL,
+    pulled_at TEXT,
+    row_count INTEGER,
+    remote_edits INTEGER DEFAULT 0,
+    stale INTEGER DEFAULT 0,
+    read_at TEXT
+);
+CREATE TABLE IF NOT EXISTS _outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sheet TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_status ON _outbox (status, sheet);
+CREATE TABLE IF NOT EXISTS _conflicts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sheet TEXT NOT NULL,
+    key_value TEXT,
+    local_row TEXT,
+    remote_row TEXT,
+    detected_at TEXT NOT NULL
+);
+"""
+
+
+def mirror_path(store_dir=None):
+    return os.path.join(store_dir or STORE_DIR, MIRROR_FILE)
+
+
+def open_mirror(path=None):
+    """Open (and create) the mirror database - one connection per thread"""
+    path = path or mirror_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_META_SCHEMA)
+    # Mirrors created before read_at existed
+    if 'read_at' not in {row[1] for row in conn.execute("PRAGMA table_info(_sheets)")}:
+        conn.execute("ALTER TABLE _sheets ADD COLUMN read_at TEXT")
+    return conn
+
+
+def _now():
+    return pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _table(sheet):
+    return _quote(f"sheet_{sheet}")
+
+
+def _row_hash(values):
+    return hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+def _clean_headers(raw_headers):
+    """(position, header) in sheet order for every non-empty, first-occurrence header"""
+    seen = set()
+    columns = []
+    for pos, header in enumerate(raw_headers):
+        header = str(header).strip()
+        if header and header not in seen:
+            seen.add(header)
+            columns.append((pos, header))
+    return columns
+
+
+def _sql_columns(headers):
+    """
+    Table column per header, same order. SQLite compares column names
+    without case, so a header whose casefold is taken gets a __2, __3 ...
+    suffix (Sheet4: 'Status', 'status' -> 'Status', 'status__2').
+    """
+    taken = set()
+    columns = []
+    for header in headers:
+        column, n = header, 1
+        while column.casefold() in taken:
+            n += 1
+            column = f"{header}__{n}"
+        taken.add(column.casefold())
+        columns.append(column)
+    return columns
+
+
+def values_frame(values):
+    """
+    get_all_values() output as a text DataFrame with the headers and rows
+    the mirror stores (blank rows dropped). Readers that bypass the mirror
+    (report_job, SHEET_MIRROR=0) use it so every path sees the same text.
+    """
+    values = values or [[]]
+    columns = _clean_headers(values[0])
+    width = len(values[0])
+    rows = []
+    for raw in values[1:]:
+        raw = [str(v) for v in raw] + [""] * (width - len(raw))
+        if any(v.strip() for v in raw):
+            rows.append([raw[pos] for pos, _ in columns])
+    return pd.DataFrame(rows, columns=[h for _, h in columns])
+
+
+def mirror_headers(conn, sheet):
+    """Headers of the mirrored sheet (None if it was never pulled)"""
+    row = conn.execute("SELECT headers FROM _sheets WHERE sheet = ?", (sheet,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def _age_seconds(pulled_at, now):
+    return (now - pd.Timestamp(pulled_at)).total_seconds() if pulled_at else float('inf')
+
+
+def is_fresh(conn, sheet, max_age=None):
+    """True if the sheet has been pulled, not marked stale since and (with max_age) is recent enough"""
+    row = conn.execute("SELECT stale, pulled_at FROM _sheets WHERE sheet = ?", (sheet,)).fetchone()
+    if row is None or row[0]:
+        return False
+    return max_age is None or _age_seconds(row[1], pd.Timestamp.now()) <= max_age
+
+
+def due_sheets(conn, sheets=None, max_age=MAX_AGE_SECONDS):
+    """
+    Pulled sheets that need a pull: marked stale, or older than max_age and
+    read since their last pull. Sheets never pulled are left to the first read.
+    """
+    now = pd.Timestamp.now()
+    due = []
+    for sheet, stale, pulled_at, read_at in conn.execute("SELECT sheet, stale, pulled_at, read_at FROM _sheets"):
+        if sheets is not None and sheet not in sheets:
+            continue
+        in_use = read_at is not None and read_at >= (pulled_at or "")
+        if stale or (in_use and _age_seconds(pulled_at, now) > max_age):
+            due.append(sheet)
+    return due
+
+
+def mark_stale(conn, sheets=None):
+    """Force a pull before the next read (after a write that bypassed the mirror)"""
+    with conn:
+        if sheets is None:
+            conn.execute("UPDATE _sheets SET stale = 1")
+        else:
+            conn.executemany("UPDATE _sheets SET stale = 1 WHERE sheet = ?", [(s,) for s in sheets])
+
+
+def _create_table(conn, sheet, headers):
+    table = _table(sheet)
+    conn.execute(f"DROP TABLE IF EXISTS {table}")
+    sql_columns = _sql_columns(headers)
+    columns = ", ".join(["_sheet_row INTEGER", "_hash TEXT"] + [f"{_quote(c)} TEXT" for c in sql_columns])
+    conn.execute(f"CREATE TABLE {table} ({columns})")
+    indexed = [
+        column for header, column in zip(headers, sql_columns)
+        if header in INDEX_COLUMNS or header in DATE_COLUMNS.get(sheet, [])
+    ]
+    for pos, column in enumerate(indexed):
+        conn.execute(f"CREATE INDEX {_quote(f'idx_{sheet}_{pos}')} ON {table} ({_quote(column)})")
+
+
+def _insert_rows(conn, sheet, headers, rows):
+    """rows: (sheet_row, hash, [values in headers order])"""
+    placeholders = ", ".join("?" * (len(headers) + 2))
+    conn.executemany(
+        f"INSERT INTO {_table(sheet)} VALUES ({placeholders})",
+        [(sheet_row, row_hash, *values) for sheet_row, row_hash, values in rows],
+    )
+
+
+def _pending(conn, sheet=None):
+    query = "SELECT id, sheet, payload FROM _outbox WHERE status = 'pending'"
+    params = ()
+    if sheet is not None:
+        query += " AND sheet = ?"
+        params = (sheet,)
+    return [(oid, s, json.loads(p)) for oid, s, p in conn.execute(query + " ORDER BY id", params)]
+
+
+def store_values(conn, sheet, values, own_rows=()):
+    """
+    Replace the local copy of a sheet with get_all_values() output.
+    Pending local appends are re-applied on top. Returns the number of
+    rows added or changed in the sheet since the previous pull (own_rows =
+    rows this process just appended, not counted).
+    """
+    values = values or [[]]
+    columns = _clean_headers(values[0])
+    headers = [h for _, h in columns]
+    width = len(values[0])
+
+    rows = []
+    for sheet_row, raw in enumerate(values[1:], start=2):
+        raw = [str(v) for v in raw] + [""] * (width - len(raw))
+        if not any(v.strip() for v in raw):
+            continue
+        rows.append((sheet_row, _row_hash(raw), [raw[pos] for pos, _ in columns]))
+
+    with conn:
+        known = mirror_headers(conn, sheet)
+        if known != headers:
+            _create_table(conn, sheet, headers)
+            previous = set()
+        else:
+            previous = {h for (h,) in conn.execute(f"SELECT _hash FROM {_table(sheet)} WHERE _hash IS NOT NULL")}
+            previous.update(_row_hash([str(v) for v in row]) for row in own_rows)
+            conn.execute(f"DELETE FROM {_table(sheet)}")
+
+        _insert_rows(conn, sheet, headers, rows)
+        local = [(None, None, [payload.get(h, "") for h in headers]) for _, _, payload in _pending(conn, sheet)]
+        _insert_rows(conn, sheet, headers, local)
+
+        remote_edits = sum(1 for _, row_hash, _ in rows if row_hash not in previous) if previous else 0
+        conn.execute(
+            "INSERT OR REPLACE INTO _sheets (sheet, headers, pulled_at, row_count, remote_edits, stale) "
+            "VALUES (?, ?, ?, ?, ?, 0)",
+            (sheet, json.dumps(headers), _now(), len(rows), remote_edits),
+        )
+    return remote_edits
+
+
+def pull_sheet(conn, spreadsheet, sheet):
+    """Fetch one worksheet into the mirror (False if the worksheet does not exist)"""
+    try:
+        worksheet = spreadsheet.worksheet(sheet)
+    except gspread.exceptions.WorksheetNotFound:
+        return False
+    remote_edits = store_values(conn, sheet, worksheet.get_all_values())
+    if remote_edits:
+        logger.info(f"Mirror pull {sheet}: {remote_edits} row(s) changed in the sheet")
+    return True
+
+
+def enqueue_append(conn, sheet, row):
+    """
+    Queue a new row for the sheet and make it visible locally right away.
+    row: {header: value}. Returns the outbox id.
+    """
+    payload = {str(k).strip(): "" if v is None else str(v) for k, v in row.items()}
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO _outbox (sheet, payload, created_at) VALUES (?, ?, ?)",
+            (sheet, json.dumps(payload), _now()),
+        )
+        headers = mirror_headers(conn, sheet)
+        if headers is not None:
+            _insert_rows(conn, sheet, headers, [(None, None, [payload.get(h, "") for h in headers])])
+    return cursor.lastrowid
+
+
+def push_pending(conn, spreadsheet):
+    """
+    Write queued appends to Google Sheets (one append_rows per sheet) and
+    refresh those sheets in the mirror from the same read.
+    Returns dict: pushed, conflicts, sheets (refreshed sheet names).
+    """
+    summary = {'pushed': 0, 'conflicts': 0, 'sheets': []}
+    by_sheet = {}
+    for oid, sheet, payload in _pending(conn):
+        by_sheet.setdefault(sheet, []).append((oid, payload))
+
+    for sheet, items in by_sheet.items():
+        try:
+            worksheet = spreadsheet.worksheet(sheet)
+            values = worksheet.get_all_values() or [[]]
+        except Exception as e:
+            logger.error(f"Mirror push {sheet}: cannot read sheet: {e}")
+            # shown by outbox_rows; cleared when a later push succeeds
+            with conn:
+                conn.executemany(
+                    "UPDATE _outbox SET error = ? WHERE id = ?",
+                    [(f"cannot read sheet: {e}", oid) for oid, _ in items],
+                )
+            continue
+
+        raw_headers = values[0]
+        key_column = KEY_COLUMNS.get(sheet)
+        key_pos = next((pos for pos, h in _clean_headers(raw_headers) if h == key_column), None)
+        remote_rows = {}
+        if key_pos is not None:
+            for raw in values[1:]:
+                if key_pos < len(raw) and str(raw[key_pos]).strip():
+                    remote_rows[str(raw[key_pos]).strip()] = raw
+
+        rows, done, conflicts = [], [], []
+        for oid, payload in items:
+            key_value = payload.get(key_column, "").strip() if key_column else ""
+            if key_value and key_value in remote_rows:
+                conflicts.append((oid, key_value, payload, remote_rows[key_value]))
+                continue
+            row = [payload.get(str(h).strip(), "") for h in raw_headers]
+            rows.append(row)
+            done.append(oid)
+            if key_value:
+                remote_rows[key_value] = row
+
+        try:
+            if rows:
+                worksheet.append_rows(rows, value_input_option='RAW')
+        except Exception as e:
+            logger.error(f"Mirror push {sheet}: append failed: {e}")
+            with conn:
+                conn.executemany("UPDATE _outbox SET error = ? WHERE id = ?", [(str(e), oid) for oid in done])
+            continue
+
+        with conn:
+            conn.executemany("UPDATE _outbox SET status = 'done', error = NULL WHERE id = ?", [(oid,) for oid in done])
+            for oid, key_value, payload, remote in conflicts:
+                conn.execute("UPDATE _outbox SET status = 'conflict' WHERE id = ?", (oid,))
+                conn.execute(
+                    "INSERT INTO _conflicts (sheet, key_value, local_row, remote_row, detected_at) VALUES (?, ?, ?, ?, ?)",
+                    (sheet, key_value, json.dumps(payload), json.dumps(dict(zip(raw_headers, remote))), _now()),
+                )
+        if conflicts:
+            logger.warning(f"Mirror push {sheet}: {len(conflicts)} append(s) collide with rows added in the sheet")
+
+        store_values(conn, sheet, values + rows, own_rows=rows)
+        summary['pushed'] += len(rows)
+        summary['conflicts'] += len(conflicts)
+        summary['sheets'].append(sheet)
+    return summary
+
+
+def sync_mirror(conn, spreadsheet, sheets=MIRROR_SHEETS, max_age=MAX_AGE_SECONDS):
+    """
+    Push queued writes (those sheets are refreshed from the same read), then
+    pull the other sheets that are due. Returns push summary + 'pulled'.
+    """
+    summary = push_pending(conn, spreadsheet)
+    summary['pulled'] = []
+    for sheet in due_sheets(conn, sheets, max_age):
+        if sheet not in summary['sheets'] and pull_sheet(conn, spreadsheet, sheet):
+            summary['pulled'].append(sheet)
+    return summary
+
+
+def read_frame(conn, sheet):
+    """
+    Mirrored sheet as a DataFrame of text with the sheet's headers (sheet
+    order, unpushed rows last). Records the read so the sync worker keeps
+    the sheet fresh while it is in use.
+    """
+    headers = mirror_headers(conn, sheet)
+    if not headers:
+        return pd.DataFrame()
+    columns = ", ".join(_quote(c) for c in _sql_columns(headers))
+    df = pd.read_sql_query(
+        f"SELECT {columns} FROM {_table(sheet)} ORDER BY _sheet_row IS NULL, _sheet_row, rowid", conn
+    )
+    df.columns = headers
+    with conn:
+        conn.execute("UPDATE _sheets SET read_at = ? WHERE sheet = ?", (_now(), sheet))
+    return df
+
+
+def mirror_status(conn):
+    """Per-sheet pull info + outbox/conflict counts for display"""
+    sheets = pd.read_sql_query(
+        "SELECT sheet AS Sheet, row_count AS Rows, pulled_at AS 'Pulled At', "
+        "remote_edits AS 'Remote Edits', stale AS Stale FROM _sheets ORDER BY sheet", conn
+    )
+    pending, conflicts = conn.execute(
+        "SELECT SUM(status = 'pending'), SUM(status = 'conflict') FROM _outbox"
+    ).fetchone()
+    return {'sheets': sheets, 'pending': int(pending or 0), 'conflicts': int(conflicts or 0)}
+
+
+def conflict_rows(conn, limit=50):
+    """Most recent conflicts (local row vs the row already in the sheet)"""
+    return pd.read_sql_query(
+        "SELECT sheet AS Sheet, key_value AS 'Key', detected_at AS 'Detected At', "
+        "local_row AS 'Local Row', remote_row AS 'Sheet Row' FROM _conflicts ORDER BY id DESC LIMIT ?",
+        conn, params=(limit,),
+    )
+
+
+def outbox_rows(conn, ids):
+    """
+    Queued appends by outbox id: id, Sheet, Key, Status ('pending' / 'done' /
+    'conflict'), Error (last push failure of a pending row), Created At
+    """
+    ids = [int(i) for i in ids]
+    if not ids:
+        return pd.DataFrame(columns=['id', 'Sheet', 'Key', 'Status', 'Error', 'Created At'])
+    rows = conn.execute(
+        f"SELECT id, sheet, payload, status, error, created_at FROM _outbox "
+        f"WHERE id IN ({', '.join('?' * len(ids))}) ORDER BY id",
+        ids,
+    ).fetchall()
+    return pd.DataFrame(
+        [
+            (oid, sheet, json.loads(payload).get(KEY_COLUMNS.get(sheet, ""), ""), status, error, created_at)
+            for oid, sheet, payload, status, error, created_at in rows
+        ],
+        columns=['id', 'Sheet', 'Key', 'Status', 'Error', 'Created At'],
+    )
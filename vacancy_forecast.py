@@ -0,0 +1,218 @@
+# vacancy_forecast.py
+# ====================================================
+# VACANCY TIME-TO-CLOSE FORECAST (no Streamlit UI)
+# ====================================================
+# Kaplan-Meier survival curves (NumPy only) of "days from Date Added until the
+# vacancy closed", fitted on the historical snapshot overall and per Urgency
+# Level, Industry (from CID) and City. Sheet4 has no close date, so a closed
+# vacancy's close time is the last 'Selected' update on its (CID, Job Title);
+# open vacancies are censored at today.
+#
+# fit_forecast() returns plain arrays (cache it per snapshot); predictions for
+# every vacancy are a searchsorted on the fitted curve.
+
+import numpy as np
+import pandas as pd
+
+
+# Strata tried in this order; the first with enough closures is used
+STRATA = {'Urgency': 'Urgency Level', 'Industry': 'Industry', 'City': 'City'}
+
+# Closed vacancies a curve needs before it is trusted over the overall curve
+MIN_EVENTS = 5
+
+UNKNOWN = 'Unknown'
+
+
+def kaplan_meier(durations, events):
+    """
+    Kaplan-Meier estimate.
+
+    Args:
+        durations: days observed per vacancy
+        events: True if the vacancy closed (False = still open, censored)
+    Returns (times, survival) - survival[i] = P(still open after times[i] days)
+    """
+    durations = np.asarray(durations, dtype=float)
+    events = np.asarray(events, dtype=bool)
+    times = np.unique(durations[events])
+    if len(times) == 0:
+        return times, np.ones(0)
+
+    at_risk = len(durations) - np.searchsorted(np.sort(durations), times, side='left')
+    closed = np.bincount(np.searchsorted(times, durations[events]), minlength=len(times))
+    survival = np.cumprod(1.0 - closed / at_risk)
+    return times, survival
+
+
+def survival_at(times, survival, t):
+    """S(t) for an array of t (1.0 before the first closure)"""
+    idx = np.searchsorted(times, np.asarray(t, dtype=float), side='right')
+    padded = np.concatenate([[1.0], survival])
+    return padded[idx]
+
+
+def remaining_median(times, survival, elapsed):
+    """
+    Median additional days until close, given the vacancy has been open
+    `elapsed` days (array). NaN where the curve never gets that low.
+    """
+    elapsed = np.asarray(elapsed, dtype=float)
+    if len(times) == 0:
+        return np.full(elapsed.shape, np.nan)
+    target = survival_at(times, survival, elapsed) * 0.5
+    # survival is non-increasing: first index with survival <= target
+    idx = np.searchsorted(-survival, -target, side='left')
+    found = idx < len(times)
+    result = np.full(elapsed.shape, np.nan)
+    result[found] = np.maximum(times[idx[found]] - elapsed[found], 0.0)
+    return result
+
+
+def _text(df, column):
+    if column not in df.columns:
+        return pd.Series(UNKNOWN, index=df.index)
+    text = df[column].astype(str).str.strip()
+    return text.mask(text.isin(["", "nan", "None"]), UNKNOWN)
+
+
+def vacancy_lifetimes(vacancies_df, interviews_df, companies_df=None, now=None):
+    """
+    One row per vacancy: CID, Job Title, Date Added, Vacancy Count/Filled,
+    Closed, Days (observed duration), Event (closed with a known close time)
+    and the strata columns.
+    """
+    now = pd.Timestamp(now or pd.Timestamp.now())
+    vac = vacancies_df
+    frame = pd.DataFrame({
+        'CID': _text(vac, 'CID'),
+        'Job Title': _text(vac, 'Job Title'),
+        'Date Added': pd.to_datetime(vac.get('Date Added', pd.Series(pd.NaT, index=vac.index)), errors='coerce'),
+        'Vacancy Count': pd.to_numeric(vac.get('Vacancy Count', pd.Series(0, index=vac.index)), errors='coerce').fillna(0),
+        'Vacancy Filled': pd.to_numeric(vac.get('Vacancy Filled', pd.Series(0, index=vac.index)), errors='coerce').fillna(0),
+        'Urgency Level': _text(vac, 'Urgency Level'),
+        'City': _text(vac, 'Job Location/City'),
+    })
+    status_col = 'status' if 'status' in vac.columns else 'Status'
+    frame['Closed'] = _text(vac, status_col).str.upper().eq('CLOSED')
+
+    industry = pd.Series(UNKNOWN, index=frame.index)
+    if companies_df is not None and len(companies_df) > 0 and {'CID', 'Industry'} <= set(companies_df.columns):
+        lookup = companies_df.assign(CID=companies_df['CID'].astype(str).str.strip()).drop_duplicates('CID')
+        industry = frame['CID'].map(lookup.set_index('CID')['Industry']).astype('string').str.strip()
+        industry = industry.mask(industry.isna() | (industry == ""), UNKNOWN)
+    frame['Industry'] = industry
+
+    # Close time = last 'Selected' update for the vacancy
+    close_time = pd.Series(pd.NaT, index=frame.index, dtype='datetime64[ns]')
+    if len(interviews_df) > 0 and {'CID', 'Job Title', 'Result Status', 'Last Updated'} <= set(interviews_df.columns):
+        selected = interviews_df[interviews_df['Result Status'] == 'Selected']
+        last_selected = (
+            pd.to_datetime(selected['Last Updated'], errors='coerce')
+            .groupby([selected['CID'].astype(str).str.strip(), selected['Job Title'].astype(str).str.strip()])
+            .max()
+        )
+        keys = pd.MultiIndex.from_arrays([frame['CID'], frame['Job Title']])
+        close_time = pd.Series(last_selected.reindex(keys).to_numpy(), index=frame.index)
+    frame['Close Time'] = pd.to_datetime(close_time).where(frame['Closed'])
+
+    end = frame['Close Time'].fillna(now)
+    frame['Days'] = ((end - frame['Date Added']) / pd.Timedelta(days=1)).clip(lower=0)
+    frame['Event'] = frame['Closed'] & frame['Close Time'].notna()
+    # Closed but with no known close time cannot be placed on the curve
+    frame['Usable'] = frame['Date Added'].notna() & (frame['Event'] | ~frame['Closed'])
+    return frame
+
+
+def fit_forecast(vacancies_df, interviews_df, companies_df=None, now=None):
+    """
+    Fit survival curves on the snapshot.
+
+    Returns dict:
+        fitted_at - timestamp
+        overall   - (times, survival, closures, vacancies)
+        curves    - {(stratum, value): (times, survival, closures, vacancies)}
+    """
+    now = pd.Timestamp(now or pd.Timestamp.now())
+    model = {'fitted_at': now, 'overall': (np.zeros(0), np.ones(0), 0, 0), 'curves': {}}
+    if len(vacancies_df) == 0:
+        return model
+
+    life = vacancy_lifetimes(vacancies_df, interviews_df, companies_df, now)
+    life = life[life['Usable']]
+    if len(life) == 0:
+        return model
+
+    def _fit(rows):
+        times, survival = kaplan_meier(rows['Days'].to_numpy(), rows['Event'].to_numpy())
+        return times, survival, int(rows['Event'].sum()), len(rows)
+
+    model['overall'] = _fit(life)
+    for stratum, column in STRATA.items():
+        for value, rows in life.groupby(column):
+            model['curves'][(stratum, value)] = _fit(rows)
+    return model
+
+
+def predict_close(model, vacancies_df, interviews_df, companies_df=None, now=None):
+    """
+    Expected close date for every open vacancy.
+
+    Returns DataFrame: CID, Job Title, Urgency Level, Industry, City,
+    Days Open, Fill Rate %, Expected Close, Days Left, Basis
+    """
+    columns = ['CID', 'Job Title', 'Urgency Level', 'Industry', 'City',
+               'Days Open', 'Fill Rate %', 'Expected Close', 'Days Left', 'Basis']
+    if len(vacancies_df) == 0:
+        return pd.DataFrame(columns=columns)
+
+    now = pd.Timestamp(now or pd.Timestamp.now())
+    life = vacancy_lifetimes(vacancies_df, interviews_df, companies_df, now)
+    open_rows = life[~life['Closed'] & life['Date Added'].notna()].copy()
+    if len(open_rows) == 0:
+        return pd.DataFrame(columns=columns)
+
+    # Pick the most specific trusted curve per vacancy
+    open_rows['Basis'] = 'Overall'
+    chosen = pd.Series(False, index=open_rows.index)
+    for stratum, column in STRATA.items():
+        trusted = {
+            value for (s, value), curve in model['curves'].items()
+            if s == stratum and value != UNKNOWN and curve[2] >= MIN_EVENTS
+        }
+        pick = open_rows[column].isin(trusted) & ~chosen
+        open_rows.loc[pick, 'Basis'] = stratum + ': ' + open_rows.loc[pick, column]
+        chosen |= pick
+
+    days_left = pd.Series(np.nan, index=open_rows.index)
+    for basis, rows in open_rows.groupby('Basis'):
+        if basis == 'Overall':
+            times, survival = model['overall'][:2]
+        else:
+            stratum, value = basis.split(': ', 1)
+            times, survival = model['curves'][(stratum, value)][:2]
+        days_left.loc[rows.index] = remaining_median(times, survival, rows['Days'].to_numpy())
+
+    count = open_rows['Vacancy Count'].replace(0, np.nan)
+    result = pd.DataFrame({
+        'CID': open_rows['CID'],
+        'Job Title': open_rows['Job Title'],
+        'Urgency Level': open_rows['Urgency Level'],
+        'Industry': open_rows['Industry'],
+        'City': open_rows['City'],
+        'Days Open': open_rows['Days'].round(0).astype(int),
+        'Fill Rate %': (open_rows['Vacancy Filled'] / count * 100).round(1),
+        'Expected Close': (now + pd.to_timedelta(days_left, unit='D')).dt.normalize(),
+        'Days Left': days_left.round(0),
+        'Basis': open_rows['Basis'],
+    })
+    return result.sort_values('Expected Close', na_position='last').reset_index(drop=True)
+
+
+def survival_curve(model, stratum=None, value=None):
+    """Step curve as DataFrame (Days -> Still Open %) for charting"""
+    times, survival = (model['overall'] if stratum is None
+                       else model['curves'].get((stratum, value), (np.zeros(0), np.ones(0), 0, 0)))[:2]
+    days = np.concatenate([[0.0], times])
+    still_open = np.concatenate([[1.0], survival]) * 100
+    return pd.DataFrame({'Still Open %': still_open}, index=pd.Index(days, name='Days'))